@@ -5,6 +5,7 @@ the container-build matrix, which would cause CI to silently skip building it.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -26,14 +27,24 @@ def get_repo_root() -> Path:
 
 
 def discover_container_files(repo_root: Path, search_roots: list[str]) -> list[Path]:
-    """Recursively find all Containerfile/Dockerfile paths under search_roots."""
+    """Recursively find all Containerfile/Dockerfile paths under search_roots.
+
+    Each root is walked once with ``os.scandir``, matching every container
+    filename from the same directory listing instead of one ``rglob`` per name.
+    """
     found = []
     for root in search_roots:
-        base = repo_root / root
-        if not base.exists():
-            continue
-        for name in CONTAINER_FILENAMES:
-            found.extend(base.rglob(name))
+        stack = [str(repo_root / root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name in CONTAINER_FILENAMES:
+                            found.append(Path(entry.path))
+            except OSError:
+                continue
     return sorted(found)
 
 
@@ -138,9 +149,11 @@ def _print_results(results: list[dict], all_matched: bool, workflow_path: str) -
     """Print check results to stdout."""
     print(f"🔍 Checking container build matrix entries in {workflow_path}...")
 
-    unmatched = [r for r in results if r["status"] == "unmatched"]
-    ignored = [r for r in results if r["status"] == "ignored"]
-    ok = [r for r in results if r["status"] == "ok"]
+    # Bucket results by status in a single pass over the list.
+    by_status: dict[str, list[dict]] = {"unmatched": [], "ignored": [], "ok": []}
+    for r in results:
+        by_status[r["status"]].append(r)
+    unmatched, ignored, ok = by_status["unmatched"], by_status["ignored"], by_status["ok"]
 
     if ignored:
         print()
@@ -11,6 +11,7 @@ from __future__ import annotations
 import argparse
 import ast
 import fnmatch
+import os
 import sys
 from functools import lru_cache
 from pathlib import Path
@@ -59,21 +60,21 @@ class ImportGuardConfig:
 
     def is_allowed(self, module: str, file_path: Path) -> bool:
         """Return True when a module is allow-listed for the given file path."""
-        canonical_module = canonicalize_module_name(module)
-        if canonical_module in self.module_allowlist:
-            return True
+        return canonicalize_module_name(module) in self.allowed_modules(file_path)
+
+    def allowed_modules(self, file_path: Path) -> frozenset[str]:
+        """Return every module allow-listed for the given file path.
+
+        Resolving the path and matching the scoped allow lists happens once per
+        file, so each import in that file is checked with a set lookup.
+        """
+        allowed = set(self.module_allowlist)
 
         resolved = file_path.resolve()
 
         # Check exact path matches (backward compatibility)
-        modules = self.path_scoped_allowlist.get(resolved)
-        if modules and canonical_module in modules:
-            return True
-
-        for parent in resolved.parents:
-            modules = self.path_scoped_allowlist.get(parent)
-            if modules and canonical_module in modules:
-                return True
+        for path in (resolved, *resolved.parents):
+            allowed.update(self.path_scoped_allowlist.get(path, ()))
 
         # Check pattern matches
         # Convert resolved path to relative path from current working directory for pattern matching
@@ -83,19 +84,15 @@ class ImportGuardConfig:
             # If file is not relative to cwd, use full path
             rel_path = str(resolved)
 
+        # Also check parent directories in the path; the last candidate is the file itself
+        path_parts = rel_path.split("/")
+        candidates = ["/".join(path_parts[: i + 1]) for i in range(len(path_parts))]
+
         for pattern, modules in self.pattern_scoped_allowlist.items():
-            if canonical_module in modules:
-                # Check if the file path matches the pattern
-                if fnmatch.fnmatch(rel_path, pattern):
-                    return True
-                # Also check parent directories in the path
-                path_parts = rel_path.split("/")
-                for i in range(len(path_parts)):
-                    partial_path = "/".join(path_parts[: i + 1])
-                    if fnmatch.fnmatch(partial_path, pattern):
-                        return True
+            if not modules <= allowed and any(fnmatch.fnmatch(candidate, pattern) for candidate in candidates):
+                allowed.update(modules)
 
-        return False
+        return frozenset(allowed)
 
 
 def canonicalize_module_name(name: str) -> str:
@@ -115,10 +112,14 @@ def discover_python_files(paths: Sequence[str]) -> list[Path]:
         if path.is_file() and path.suffix == ".py":
             python_files.append(path)
         elif path.is_dir():
-            for candidate in path.rglob("*.py"):
-                if any(part.startswith(".") for part in candidate.parts):
-                    continue
-                python_files.append(candidate)
+            # Prune hidden directories while walking rather than descending into
+            # them (e.g. .git, .venv) and filtering every candidate afterwards.
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                root = Path(dirpath)
+                python_files.extend(
+                    root / name for name in filenames if name.endswith(".py") and not name.startswith(".")
+                )
 
     return python_files
 
@@ -181,6 +182,7 @@ def check_imports(files: Sequence[Path], config: ImportGuardConfig, *, quiet: bo
 
     for file_path in files:
         resolved_path = file_path.resolve()
+        allowed_modules: Optional[frozenset[str]] = None
         try:
             with resolved_path.open("r", encoding="utf-8") as handle:
                 tree = ast.parse(handle.read(), filename=str(resolved_path))
@@ -191,7 +193,9 @@ def check_imports(files: Sequence[Path], config: ImportGuardConfig, *, quiet: bo
         for module_name, lineno in extract_top_level_imports(tree):
             if module_name in stdlib_modules:
                 continue
-            if config.is_allowed(module_name, resolved_path):
+            if allowed_modules is None:
+                allowed_modules = config.allowed_modules(resolved_path)
+            if module_name in allowed_modules:
                 continue
             violations.append(
                 f"{resolved_path}:{lineno} imports non-stdlib module '{module_name}' at top level",
@@ -143,6 +143,23 @@ class TestImportGuardConfig:
 
             assert config.is_allowed("pytest", test_file)
 
+    def test_allowed_modules_combines_all_scopes(self):
+        """Test that global, path-scoped and pattern-scoped modules are merged for a file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir).resolve()
+            test_file = tmpdir_path / "subdir" / "test.py"
+
+            config = ImportGuardConfig(
+                module_allowlist=["pandas"],
+                path_scoped_allowlist={
+                    str(tmpdir_path): ["pytest"],
+                    f"{tmpdir_path}/sub*": ["torch.nn"],
+                    f"{tmpdir_path}/other/*": ["mock"],
+                },
+            )
+
+            assert config.allowed_modules(test_file) == frozenset({"pandas", "pytest", "torch"})
+
 
 class TestDiscoverPythonFiles:
     """Test the discover_python_files function."""
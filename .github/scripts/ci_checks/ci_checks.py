@@ -8,13 +8,21 @@ import logging
 import subprocess
 import sys
 import time
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser is used when it is not installed
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 _PASSING_CONCLUSIONS = frozenset({"success", "neutral", "skipped"})
 _TRUSTED_ASSOCIATIONS = frozenset({"MEMBER", "OWNER", "COLLABORATOR"})
 _TRUSTED_BOT_LOGINS = frozenset({"dependabot[bot]"})
+_CHECK_RUNS_PER_PAGE = 100
 
 
 class ChecksError(Exception):
@@ -22,24 +30,67 @@ class ChecksError(Exception):
 
 
 class GhClient:
-    """Wraps subprocess calls to the gh CLI."""
+    """Wraps subprocess calls to the gh CLI.
+
+    ``gh api`` reads and idempotent edits such as label removal are retried with
+    exponential backoff so a transient GitHub API error (e.g. 502 or rate
+    limiting) does not fail the job.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff: float = 0.5) -> None:
+        """Initialize with the retry policy for gh calls."""
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+
+    def _run(self, *args: str, capture_stdout: bool = True, text: bool = True) -> str | bytes:
+        """Run ``gh`` with *args* and return stdout, retrying failed attempts.
+
+        When *capture_stdout* is False, stdout is discarded instead of piped
+        back; stderr is still captured for the error raised on failure. With
+        *text* False, stdout is returned as undecoded bytes.
+        """
+        cmd = ["gh", *args]
+        stdout = subprocess.PIPE if capture_stdout else subprocess.DEVNULL
+        for attempt in range(1, self.max_attempts):
+            try:
+                return subprocess.run(cmd, stdout=stdout, stderr=subprocess.PIPE, text=text, check=True).stdout
+            except subprocess.CalledProcessError as exc:
+                delay = self.backoff * 2 ** (attempt - 1)
+                logger.warning(
+                    "%s failed (exit %d); retrying in %.1fs (%d/%d)",
+                    " ".join(cmd),
+                    exc.returncode,
+                    delay,
+                    attempt,
+                    self.max_attempts,
+                )
+                time.sleep(delay)
+        return subprocess.run(cmd, stdout=stdout, stderr=subprocess.PIPE, text=text, check=True).stdout
+
+    def _api(self, endpoint: str, *flags: str) -> bytes:
+        """Run ``gh api`` against *endpoint* and return the raw JSON output.
+
+        The output is left as bytes; both JSON parsers accept it without a
+        separate decode pass.
+        """
+        return self._run("api", *flags, endpoint, text=False)
 
     def remove_label(self, repo: str, pr_number: int, label: str) -> None:
         """Remove a label from a PR via ``gh pr edit``."""
-        subprocess.run(
-            ["gh", "pr", "edit", str(pr_number), "--remove-label", label, "--repo", repo],
-            check=True,
-        )
+        self._run("pr", "edit", str(pr_number), "--remove-label", label, "--repo", repo, capture_stdout=False)
 
     def get_check_runs(self, repo: str, head_sha: str) -> dict:
-        """Return parsed JSON from the GitHub check-runs API."""
-        result = subprocess.run(
-            ["gh", "api", "--paginate", f"repos/{repo}/commits/{head_sha}/check-runs"],
-            capture_output=True,
-            text=True,
-            check=True,
+        """Return parsed JSON from the GitHub check-runs API.
+
+        Fetches the largest page size the API allows so a single request
+        usually covers every check run. ``gh api --paginate`` prints one JSON
+        document per page; their ``check_runs`` lists are merged into one response.
+        """
+        output = self._api(
+            f"repos/{repo}/commits/{head_sha}/check-runs?per_page={_CHECK_RUNS_PER_PAGE}",
+            "--paginate",
         )
-        return json.loads(result.stdout)
+        return _merge_check_run_pages(output)
 
     def get_own_check_run_id(self, repo: str, head_sha: str, check_name: str) -> int:
         """Return the ID of the check run matching *check_name*.
@@ -61,6 +112,36 @@ class GhClient:
         raise ChecksError(f"Check run '{check_name}' not found")
 
 
+def _merge_check_run_pages(output: str | bytes) -> dict:
+    """Merge the concatenated JSON pages printed by ``gh api --paginate``.
+
+    The common single-page response is parsed in one call, with orjson when it
+    is available; only multi-page output is split document by document.
+    """
+    if not output.strip():
+        return {}
+    try:
+        return orjson.loads(output) if orjson is not None else json.loads(output)
+    except ValueError:
+        pass
+
+    if isinstance(output, bytes):
+        output = output.decode()
+    decoder = json.JSONDecoder()
+    merged: dict | None = None
+    index = 0
+    output = output.strip()
+    while index < len(output):
+        page, index = decoder.raw_decode(output, index)
+        while index < len(output) and output[index].isspace():
+            index += 1
+        if merged is None:
+            merged = page
+        else:
+            merged.setdefault("check_runs", []).extend(page.get("check_runs", []))
+    return merged if merged is not None else {}
+
+
 def is_trusted_association(author_association: str) -> bool:
     """Return True if *author_association* represents a trusted contributor."""
     return author_association in _TRUSTED_ASSOCIATIONS
@@ -71,7 +152,7 @@ def is_trusted_bot(author_login: str) -> bool:
     return author_login in _TRUSTED_BOT_LOGINS
 
 
-def should_run_checks(labels: list[str], *, author_association: str, author_login: str = "") -> bool:
+def should_run_checks(labels: Collection[str], *, author_association: str, author_login: str = "") -> bool:
     """Determine whether CI checks should run based on author association, login, and PR labels."""
     if is_trusted_association(author_association):
         return True
@@ -80,7 +161,7 @@ def should_run_checks(labels: list[str], *, author_association: str, author_logi
     return "ok-to-test" in labels
 
 
-def reset_label(gh: GhClient, repo: str, pr_number: int, labels: list[str]) -> None:
+def reset_label(gh: GhClient, repo: str, pr_number: int, labels: Collection[str]) -> None:
     """Remove the ci-passed label from a PR if it is present."""
     if "ci-passed" in labels:
         gh.remove_label(repo, pr_number, "ci-passed")
@@ -166,17 +247,24 @@ def main(argv: list[str] | None = None) -> int:
     """CLI entry point."""
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     args = parse_args(argv)
-    labels = [label for label in args.labels.split(",") if label]
+    labels = frozenset(label.strip() for label in args.labels.split(",") if label.strip())
     gh = GhClient()
 
-    if args.event_action in ("synchronize", "reopened"):
-        reset_label(gh, args.repo, args.pr_number, labels)
+    run_checks = should_run_checks(labels, author_association=args.author_association, author_login=args.author_login)
+
+    # The label reset and the check-run lookup are independent gh round trips, so overlap them.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        own_check = (
+            executor.submit(gh.get_own_check_run_id, args.repo, args.head_sha, args.check_name) if run_checks else None
+        )
+        if args.event_action in ("synchronize", "reopened"):
+            reset_label(gh, args.repo, args.pr_number, labels)
+        check_run_id = own_check.result() if own_check is not None else None
 
-    if not should_run_checks(labels, author_association=args.author_association, author_login=args.author_login):
+    if not run_checks:
         logger.info("PR requires '/ok-to-test' approval. Skipping CI checks.")
         return 0
 
-    check_run_id = gh.get_own_check_run_id(args.repo, args.head_sha, args.check_name)
     ignore_checks = frozenset(name.strip() for name in args.ignore_checks.split(",") if name.strip())
 
     try:
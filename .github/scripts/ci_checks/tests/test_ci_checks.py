@@ -58,6 +58,11 @@ class FakeGhClient(GhClient):
         self._check_runs_responses = list(check_runs_responses or [])
         self._poll_count = 0
 
+    @property
+    def poll_count(self) -> int:
+        """Number of times check runs have been fetched."""
+        return self._poll_count
+
     def remove_label(self, repo: str, pr_number: int, label: str) -> None:
         """Remove a label from the tracked set."""
         self.labels.discard(label)
@@ -86,6 +91,11 @@ class FakeGhClient(GhClient):
         raise ChecksError(f"Check run '{check_name}' not found")
 
 
+def _fake_gh(*check_runs: dict) -> FakeGhClient:
+    """Build a FakeGhClient whose every poll returns *check_runs*."""
+    return FakeGhClient(check_runs_responses=[json.loads(_api_response(*check_runs))])
+
+
 # ---------------------------------------------------------------------------
 # should_run_checks
 # ---------------------------------------------------------------------------
@@ -215,25 +225,21 @@ class TestWaitForChecks:
     """Test the wait_for_checks function."""
 
     @pytest.fixture(autouse=True)
-    def _no_sleep(self):
-        """Prevent actual sleeping during polling tests."""
-        with patch("ci_checks.ci_checks.time.sleep") as self.mock_sleep:
-            yield
+    def _no_sleep(self, monkeypatch):
+        """Prevent actual sleeping during polling tests, recording each requested delay."""
+        self.sleeps = []
+        monkeypatch.setattr("ci_checks.ci_checks.time.sleep", self.sleeps.append)
 
     def test_all_checks_pass_on_first_poll(self):
         """All checks completed and passed on first poll."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(100, "lint", "completed", "success"),
-                _make_check_run(101, "test", "completed", "success"),
-            )
+        gh = _fake_gh(
+            _make_check_run(100, "lint", "completed", "success"),
+            _make_check_run(101, "test", "completed", "success"),
         )
         wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=3, interval=10)
 
     def test_pending_then_pass_on_retry(self):
         """Some checks pending on first poll, all pass on second poll."""
-        gh = MagicMock(spec=GhClient)
         pending_response = json.loads(
             _api_response(
                 _make_check_run(100, "lint", "completed", "success"),
@@ -246,62 +252,47 @@ class TestWaitForChecks:
                 _make_check_run(101, "test", "completed", "success"),
             )
         )
-        gh.get_check_runs.side_effect = [pending_response, success_response]
+        gh = FakeGhClient(check_runs_responses=[pending_response, success_response])
         wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=3, interval=10)
 
     def test_check_fails(self):
         """A check fails -- should raise ChecksError."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(100, "lint", "completed", "success"),
-                _make_check_run(101, "test", "completed", "failure"),
-            )
+        gh = _fake_gh(
+            _make_check_run(100, "lint", "completed", "success"),
+            _make_check_run(101, "test", "completed", "failure"),
         )
         with pytest.raises(ChecksError):
             wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=3, interval=10)
 
     def test_multiple_checks_fail(self):
         """Multiple checks fail -- should raise ChecksError."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(100, "lint", "completed", "failure"),
-                _make_check_run(101, "test", "completed", "failure"),
-            )
+        gh = _fake_gh(
+            _make_check_run(100, "lint", "completed", "failure"),
+            _make_check_run(101, "test", "completed", "failure"),
         )
         with pytest.raises(ChecksError):
             wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=3, interval=10)
 
     def test_excludes_own_check_run_id(self):
         """Own check_run_id is excluded from evaluation; remaining checks pass."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(999, "CI Check", "in_progress"),
-                _make_check_run(100, "lint", "completed", "success"),
-            )
+        gh = _fake_gh(
+            _make_check_run(999, "CI Check", "in_progress"),
+            _make_check_run(100, "lint", "completed", "success"),
         )
         wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=3, interval=10)
 
     def test_no_other_checks_only_self(self):
         """Only the current check run exists -- should succeed."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(999, "CI Check", "in_progress"),
-            )
+        gh = _fake_gh(
+            _make_check_run(999, "CI Check", "in_progress"),
         )
         wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=3, interval=10)
 
     def test_ignore_checks_excludes_named_checks(self):
         """Checks listed in ignore_checks are excluded from evaluation."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(100, "lint", "completed", "success"),
-                _make_check_run(200, "Agent", "in_progress"),
-            )
+        gh = _fake_gh(
+            _make_check_run(100, "lint", "completed", "success"),
+            _make_check_run(200, "Agent", "in_progress"),
         )
         wait_for_checks(
             gh,
@@ -316,13 +307,10 @@ class TestWaitForChecks:
 
     def test_ignore_checks_excludes_multiple_named_checks(self):
         """Multiple checks listed in ignore_checks are all excluded."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(100, "lint", "completed", "success"),
-                _make_check_run(200, "Agent", "in_progress"),
-                _make_check_run(300, "CodeQL", "in_progress"),
-            )
+        gh = _fake_gh(
+            _make_check_run(100, "lint", "completed", "success"),
+            _make_check_run(200, "Agent", "in_progress"),
+            _make_check_run(300, "CodeQL", "in_progress"),
         )
         wait_for_checks(
             gh,
@@ -337,13 +325,10 @@ class TestWaitForChecks:
 
     def test_mixed_passing_statuses(self):
         """Mixed success, neutral, and skipped -- all treated as passing."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(100, "lint", "completed", "success"),
-                _make_check_run(101, "optional", "completed", "neutral"),
-                _make_check_run(102, "conditional", "completed", "skipped"),
-            )
+        gh = _fake_gh(
+            _make_check_run(100, "lint", "completed", "success"),
+            _make_check_run(101, "optional", "completed", "neutral"),
+            _make_check_run(102, "conditional", "completed", "skipped"),
         )
         wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=3, interval=10)
 
@@ -353,57 +338,40 @@ class TestWaitForChecks:
     )
     def test_failure_conclusions(self, conclusion):
         """Non-passing conclusions are treated as failures."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(100, "problematic", "completed", conclusion),
-            )
+        gh = _fake_gh(
+            _make_check_run(100, "problematic", "completed", conclusion),
         )
         with pytest.raises(ChecksError):
             wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=3, interval=10)
 
     def test_respects_delay_before_first_poll(self):
         """Delay is applied before the first poll."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(100, "lint", "completed", "success"),
-            )
+        gh = _fake_gh(
+            _make_check_run(100, "lint", "completed", "success"),
         )
         wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=120, retries=3, interval=10)
-        assert self.mock_sleep.call_args_list[0] == call(120)
+        assert self.sleeps[0] == 120
 
     def test_exhausts_retries_when_pending(self):
         """Checks stay pending through all retries -- should raise ChecksError."""
-        gh = MagicMock(spec=GhClient)
-        pending_response = json.loads(
-            _api_response(
-                _make_check_run(100, "slow-test", "in_progress"),
-            )
-        )
-        gh.get_check_runs.return_value = pending_response
+        gh = _fake_gh(_make_check_run(100, "slow-test", "in_progress"))
         with pytest.raises(ChecksError):
             wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=2, interval=5)
-        assert gh.get_check_runs.call_count == 2
+        assert gh.poll_count == 2
 
     def test_empty_check_runs_retries_then_fails(self):
         """No checks registered yet -- retries, eventually fails."""
-        gh = MagicMock(spec=GhClient)
-        empty_response = json.loads(_api_response())
-        gh.get_check_runs.return_value = empty_response
+        gh = _fake_gh()
         with pytest.raises(ChecksError):
             wait_for_checks(gh, "owner/repo", "abc123", check_run_id=999, delay=0, retries=2, interval=5)
-        assert gh.get_check_runs.call_count == 2
+        assert gh.poll_count == 2
 
     def test_stale_completed_run_with_same_name_excluded_by_ignore(self):
         """A stale completed check_ci_status run is excluded via ignore_checks."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(800, "check_ci_status", "completed", "failure"),
-                _make_check_run(999, "check_ci_status", "in_progress"),
-                _make_check_run(100, "lint", "completed", "success"),
-            )
+        gh = _fake_gh(
+            _make_check_run(800, "check_ci_status", "completed", "failure"),
+            _make_check_run(999, "check_ci_status", "in_progress"),
+            _make_check_run(100, "lint", "completed", "success"),
         )
         wait_for_checks(
             gh,
@@ -418,13 +386,10 @@ class TestWaitForChecks:
 
     def test_stale_failed_run_causes_false_failure_without_ignore(self):
         """Without ignore_checks, a stale failed run with the same name causes failure."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(800, "check_ci_status", "completed", "failure"),
-                _make_check_run(999, "check_ci_status", "in_progress"),
-                _make_check_run(100, "lint", "completed", "success"),
-            )
+        gh = _fake_gh(
+            _make_check_run(800, "check_ci_status", "completed", "failure"),
+            _make_check_run(999, "check_ci_status", "in_progress"),
+            _make_check_run(100, "lint", "completed", "success"),
         )
         with pytest.raises(ChecksError, match="check_ci_status"):
             wait_for_checks(
@@ -439,13 +404,10 @@ class TestWaitForChecks:
 
     def test_concurrent_in_progress_run_excluded_by_ignore(self):
         """Two concurrent in-progress runs with same name don't deadlock when using ignore_checks."""
-        gh = MagicMock(spec=GhClient)
-        gh.get_check_runs.return_value = json.loads(
-            _api_response(
-                _make_check_run(998, "check_ci_status", "in_progress"),
-                _make_check_run(999, "check_ci_status", "in_progress"),
-                _make_check_run(100, "lint", "completed", "success"),
-            )
+        gh = _fake_gh(
+            _make_check_run(998, "check_ci_status", "in_progress"),
+            _make_check_run(999, "check_ci_status", "in_progress"),
+            _make_check_run(100, "lint", "completed", "success"),
         )
         wait_for_checks(
             gh,
@@ -480,6 +442,15 @@ class TestWaitForChecks:
 # ---------------------------------------------------------------------------
 
 
+def _stub_run(monkeypatch, stdout) -> None:
+    """Make every gh invocation succeed with ``stdout``, without a MagicMock."""
+
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=stdout)
+
+    monkeypatch.setattr("ci_checks.ci_checks.subprocess.run", fake_run)
+
+
 class TestGhClient:
     """Test the GhClient class subprocess construction."""
 
@@ -492,6 +463,20 @@ class TestGhClient:
         mock_run.assert_called_once()
         cmd = mock_run.call_args[0][0]
         assert cmd == ["gh", "pr", "edit", "42", "--remove-label", "ci-passed", "--repo", "owner/repo"]
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.DEVNULL
+
+    @patch("ci_checks.ci_checks.time.sleep")
+    @patch("ci_checks.ci_checks.subprocess.run")
+    def test_remove_label_retries_transient_failure(self, mock_run, mock_sleep):
+        """remove_label retries gh pr edit after a transient failure."""
+        mock_run.side_effect = [
+            subprocess.CalledProcessError(1, "gh"),
+            subprocess.CompletedProcess(args=[], returncode=0, stdout=""),
+        ]
+        client = GhClient()
+        client.remove_label("owner/repo", 42, "ci-passed")
+        assert mock_run.call_count == 2
+        mock_sleep.assert_called_once_with(0.5)
 
     @patch("ci_checks.ci_checks.subprocess.run")
     def test_get_check_runs_builds_correct_command(self, mock_run):
@@ -501,67 +486,90 @@ class TestGhClient:
         client.get_check_runs("owner/repo", "abc123")
         mock_run.assert_called_once()
         cmd = mock_run.call_args[0][0]
-        assert cmd == ["gh", "api", "--paginate", "repos/owner/repo/commits/abc123/check-runs"]
+        assert cmd == ["gh", "api", "--paginate", "repos/owner/repo/commits/abc123/check-runs?per_page=100"]
+        assert mock_run.call_args.kwargs["text"] is False
+
+    def test_get_check_runs_merges_paginated_pages(self, monkeypatch):
+        """get_check_runs merges the check runs of every page printed by --paginate."""
+        first_page = _api_response(_make_check_run(100, "lint", "completed", "success"))
+        second_page = _api_response(_make_check_run(200, "tests", "in_progress"))
+        _stub_run(monkeypatch, f"{first_page}\n{second_page}\n".encode())
+        client = GhClient()
+        data = client.get_check_runs("owner/repo", "abc123")
+        assert [cr["id"] for cr in data["check_runs"]] == [100, 200]
 
-    @patch("ci_checks.ci_checks.subprocess.run")
-    def test_get_own_check_run_id_finds_matching_check(self, mock_run):
+    def test_get_own_check_run_id_finds_matching_check(self, monkeypatch):
         """get_own_check_run_id returns the ID of the check matching the name."""
         response = _api_response(
             _make_check_run(100, "lint", "completed", "success"),
             _make_check_run(200, "check_ci_status", "in_progress"),
         )
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=response)
+        _stub_run(monkeypatch, response)
         client = GhClient()
         assert client.get_own_check_run_id("owner/repo", "abc123", "check_ci_status") == 200
 
-    @patch("ci_checks.ci_checks.subprocess.run")
-    def test_get_own_check_run_id_prefers_in_progress(self, mock_run):
+    def test_get_own_check_run_id_prefers_in_progress(self, monkeypatch):
         """get_own_check_run_id prefers the in-progress run over a completed one."""
         response = _api_response(
             _make_check_run(200, "check_ci_status", "completed", "success"),
             _make_check_run(300, "check_ci_status", "in_progress"),
         )
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=response)
+        _stub_run(monkeypatch, response)
         client = GhClient()
         assert client.get_own_check_run_id("owner/repo", "abc123", "check_ci_status") == 300
 
-    @patch("ci_checks.ci_checks.subprocess.run")
-    def test_get_own_check_run_id_falls_back_to_completed(self, mock_run):
+    def test_get_own_check_run_id_falls_back_to_completed(self, monkeypatch):
         """get_own_check_run_id falls back to completed run when none is in-progress."""
         response = _api_response(
             _make_check_run(200, "check_ci_status", "completed", "success"),
             _make_check_run(300, "check_ci_status", "completed", "success"),
         )
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=response)
+        _stub_run(monkeypatch, response)
         client = GhClient()
         assert client.get_own_check_run_id("owner/repo", "abc123", "check_ci_status") == 200
 
-    @patch("ci_checks.ci_checks.subprocess.run")
-    def test_get_own_check_run_id_raises_when_not_found(self, mock_run):
+    def test_get_own_check_run_id_raises_when_not_found(self, monkeypatch):
         """get_own_check_run_id raises ChecksError when no check matches the name."""
         response = _api_response(
             _make_check_run(100, "lint", "completed", "success"),
         )
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=response)
+        _stub_run(monkeypatch, response)
         client = GhClient()
         with pytest.raises(ChecksError):
             client.get_own_check_run_id("owner/repo", "abc123", "check_ci_status")
 
-    @patch("ci_checks.ci_checks.subprocess.run")
-    def test_get_own_check_run_id_raises_on_empty_response(self, mock_run):
+    def test_get_own_check_run_id_raises_on_empty_response(self, monkeypatch):
         """get_own_check_run_id raises ChecksError when no check runs exist yet."""
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=_api_response())
+        _stub_run(monkeypatch, _api_response())
         client = GhClient()
         with pytest.raises(ChecksError):
             client.get_own_check_run_id("owner/repo", "abc123", "check_ci_status")
 
+    @patch("ci_checks.ci_checks.time.sleep")
     @patch("ci_checks.ci_checks.subprocess.run")
-    def test_get_own_check_run_id_propagates_api_failure(self, mock_run):
-        """get_own_check_run_id propagates errors from the API call."""
+    def test_get_own_check_run_id_propagates_api_failure(self, mock_run, mock_sleep):
+        """get_own_check_run_id propagates errors from the API call once retries are exhausted."""
         mock_run.side_effect = subprocess.CalledProcessError(1, "gh")
         client = GhClient()
         with pytest.raises(subprocess.CalledProcessError):
             client.get_own_check_run_id("owner/repo", "abc123", "check_ci_status")
+        assert mock_run.call_count == 3
+        assert mock_sleep.call_args_list == [call(0.5), call(1.0)]
+
+    @patch("ci_checks.ci_checks.time.sleep")
+    @patch("ci_checks.ci_checks.subprocess.run")
+    def test_get_check_runs_retries_transient_failure(self, mock_run, mock_sleep):
+        """get_check_runs succeeds when a retry follows a transient gh api failure."""
+        mock_run.side_effect = [
+            subprocess.CalledProcessError(1, "gh"),
+            subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=_api_response(_make_check_run(100, "lint", "completed", "success"))
+            ),
+        ]
+        client = GhClient()
+        data = client.get_check_runs("owner/repo", "abc123")
+        assert [cr["id"] for cr in data["check_runs"]] == [100]
+        mock_sleep.assert_called_once_with(0.5)
 
 
 # ---------------------------------------------------------------------------
@@ -715,6 +723,31 @@ class TestCLIIntegration:
         assert "ci-passed" in fake.labels
         assert Path(output_dir, "pr_number").exists()
 
+    @patch("ci_checks.ci_checks.GhClient")
+    def test_labels_with_surrounding_whitespace_are_matched(self, mock_gh_client_cls, tmp_path):
+        """Labels are stripped, so 'bug, ok-to-test, ci-passed' still approves and resets."""
+        fake = FakeGhClient(labels={"ci-passed"}, check_runs_responses=self._ALL_PASS)
+        mock_gh_client_cls.return_value = fake
+        output_dir = str(tmp_path / "pr")
+        result = main(
+            [
+                "--pr-number",
+                "10",
+                "--event-action",
+                "synchronize",
+                "--labels",
+                "bug, ok-to-test, ci-passed",
+                "--author-association",
+                "NONE",
+                "--output-dir",
+                output_dir,
+                *self._BASE_ARGS,
+            ]
+        )
+        assert result == 0
+        assert "ci-passed" not in fake.labels
+        assert Path(output_dir, "pr_number").exists()
+
     @patch("ci_checks.ci_checks.GhClient")
     def test_non_member_unapproved_synchronize_resets_label_but_skips_checks(self, mock_gh_client_cls, tmp_path):
         """Non-member PR (synchronize): ci-passed removed, but no payload saved."""
@@ -2,6 +2,7 @@
 """Detect changed components and pipelines in a git repository."""
 
 import argparse
+import functools
 import json
 import os
 import re
@@ -9,19 +10,37 @@ import subprocess
 import sys
 from dataclasses import dataclass, field
 
-# Patterns for matching asset paths.
+# Pattern for matching asset paths in a single pass.
 # Subcategory paths have 4 segments: <type>/<category>/<subcategory>/<name>/
 # Direct paths have 3 segments:      <type>/<category>/<name>/
-COMPONENT_SUBCAT_PATTERN = re.compile(r"^components/([^/]+)/([^/]+)/([^/]+)/")
-COMPONENT_PATTERN = re.compile(r"^components/([^/]+)/([^/]+)/")
-PIPELINE_SUBCAT_PATTERN = re.compile(r"^pipelines/([^/]+)/([^/]+)/([^/]+)/")
-PIPELINE_PATTERN = re.compile(r"^pipelines/([^/]+)/([^/]+)/")
+# The optional fourth group only matches when the path continues below it.
+ASSET_PATTERN = re.compile(r"^(components|pipelines)/([^/]+)/([^/]+)/(?:([^/]+)/)?")
 
 # Subdirectories that belong to a direct asset, not a subcategory.
 # e.g. components/<cat>/<name>/tests/... should resolve to the direct asset
 _RESERVED_SUBDIRS = {"tests", "shared"}
 
 
+@functools.lru_cache(maxsize=8192)
+def _classify_path(file_path: str) -> tuple[str, str] | None:
+    """Map a changed file path to its asset.
+
+    Args:
+        file_path: Changed file path relative to the repository root.
+
+    Returns:
+        Tuple of (asset type, asset path), e.g. ("components", "components/training/trainer"),
+        or None if the file does not belong to a component or pipeline.
+    """
+    match = ASSET_PATTERN.match(file_path)
+    if match is None:
+        return None
+    asset_type, category, second, third = match.groups()
+    if third is None or third in _RESERVED_SUBDIRS:
+        return asset_type, f"{asset_type}/{category}/{second}"
+    return asset_type, f"{asset_type}/{category}/{second}/{third}"
+
+
 @dataclass
 class DetectionResult:
     """Result of detecting changed components and pipelines."""
@@ -81,17 +100,14 @@ class GitClient:
         Args:
             base_ref: Git reference (e.g., 'origin/main', 'origin/release-1.11').
         """
-        if not base_ref.startswith("origin/"):
-            return
-
-        # origin/HEAD is a symbolic reference that exists after cloning and
-        # points to the default branch. It cannot be fetched like a regular
-        # branch since "HEAD" is not a valid branch name on the remote.
-        if base_ref == "origin/HEAD":
+        # Only remote refs are fetched. origin/HEAD is a symbolic reference that
+        # exists after cloning and points to the default branch. It cannot be
+        # fetched like a regular branch since "HEAD" is not a valid branch name
+        # on the remote.
+        prefix, _, base_branch = base_ref.partition("/")
+        if prefix != "origin" or not base_branch or base_branch == "HEAD":
             return
 
-        base_branch = base_ref.removeprefix("origin/")
-
         # Try full fetch first, then shallow fetch
         if self.run(["fetch", "origin", f"{base_branch}:refs/remotes/origin/{base_branch}"], check=False) == "":
             self.run(["fetch", "--depth=100", "origin", base_branch], check=False)
@@ -107,28 +123,16 @@ class GitClient:
         Returns:
             List of changed file paths.
         """
-        merge_base = self.run(["merge-base", base_ref, head_ref], check=False)
+        # Three-dot notation diffs head_ref against the merge base of both refs,
+        # so git resolves the merge base itself instead of in a separate process.
+        cmd = ["diff", "--name-only"]
+        if skip_deleted_files:
+            # Use --diff-filter to exclude deleted files
+            cmd.append("--diff-filter=d")  # 'd' means exclude deleted
+        cmd.append(f"{base_ref}...{head_ref}")
 
         try:
-            if skip_deleted_files:
-                # Use --diff-filter to exclude deleted files
-                diff_flag = "--diff-filter=d"  # 'd' means exclude deleted
-            else:
-                diff_flag = None
-
-            if merge_base:
-                cmd = ["diff", "--name-only"]
-                if diff_flag:
-                    cmd.append(diff_flag)
-                cmd.extend([merge_base, head_ref])
-                diff_output = self.run(cmd)
-            else:
-                # Try three-dot notation first, then two-dot
-                cmd = ["diff", "--name-only"]
-                if diff_flag:
-                    cmd.append(diff_flag)
-                cmd.append(f"{base_ref}...{head_ref}")
-                diff_output = self.run(cmd)
+            diff_output = self.run(cmd)
         except subprocess.CalledProcessError as e:
             print(f"DEBUG: Error getting changed files: {e}")
             raise
@@ -140,6 +144,8 @@ class GitClient:
 class ChangeDetector:
     """Detects changed components and pipelines between git refs."""
 
+    __slots__ = ("git",)
+
     def __init__(self, git_client: GitClient | None = None) -> None:
         """Initialize the detector.
 
@@ -206,33 +212,21 @@ class ChangeDetector:
         Returns:
             Tuple of (components, pipelines) lists.
         """
-        components: set[str] = set()
-        pipelines: set[str] = set()
+        assets: dict[str, set[str]] = {"components": set(), "pipelines": set()}
 
         for file_path in files:
-            if match := COMPONENT_SUBCAT_PATTERN.match(file_path):
-                category, second, third = match.group(1), match.group(2), match.group(3)
-                if third in _RESERVED_SUBDIRS:
-                    components.add(f"components/{category}/{second}")
-                else:
-                    components.add(f"components/{category}/{second}/{third}")
-            elif match := COMPONENT_PATTERN.match(file_path):
-                components.add(f"components/{match.group(1)}/{match.group(2)}")
-            elif match := PIPELINE_SUBCAT_PATTERN.match(file_path):
-                category, second, third = match.group(1), match.group(2), match.group(3)
-                if third in _RESERVED_SUBDIRS:
-                    pipelines.add(f"pipelines/{category}/{second}")
-                else:
-                    pipelines.add(f"pipelines/{category}/{second}/{third}")
-            elif match := PIPELINE_PATTERN.match(file_path):
-                pipelines.add(f"pipelines/{match.group(1)}/{match.group(2)}")
-
-        return sorted(components), sorted(pipelines)
+            if classified := _classify_path(file_path):
+                asset_type, asset = classified
+                assets[asset_type].add(asset)
+
+        return sorted(assets["components"]), sorted(assets["pipelines"])
 
 
 class OutputWriter:
     """Handles writing detection results to various outputs."""
 
+    __slots__ = ("result",)
+
     def __init__(self, result: DetectionResult) -> None:
         """Initialize with a detection result.
 
@@ -79,6 +79,28 @@ class TestGitClientFetchBranch:
         client.run.assert_has_calls(expected_calls)
 
 
+class TestGitClientGetChangedFiles:
+    """Test the GitClient.get_changed_files method."""
+
+    def test_get_changed_files_uses_single_three_dot_diff(self):
+        """Test that changed files come from one three-dot diff against the merge base."""
+        client = GitClient()
+        client.run = MagicMock(return_value="components/a/b/component.py\nREADME.md\n")
+
+        changed = client.get_changed_files("origin/main", "HEAD")
+
+        assert changed == ["components/a/b/component.py", "README.md"]
+        client.run.assert_called_once_with(["diff", "--name-only", "origin/main...HEAD"])
+
+    def test_get_changed_files_skips_deleted_files(self):
+        """Test that skip_deleted_files adds the diff filter excluding deletions."""
+        client = GitClient()
+        client.run = MagicMock(return_value="")
+
+        assert client.get_changed_files("origin/main", "HEAD", skip_deleted_files=True) == []
+        client.run.assert_called_once_with(["diff", "--name-only", "--diff-filter=d", "origin/main...HEAD"])
+
+
 class TestParseChangedFiles:
     """Test the ChangeDetector._parse_changed_files method."""
 
@@ -8,6 +8,20 @@ package can be imported using the kfp_components namespace.
 import argparse
 import importlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+CATEGORIES = ("training", "evaluation", "data_processing", "deployment")
+ASSET_KINDS = ("components", "pipelines")
+
+
+def _try_import(module_name: str) -> Optional[ImportError]:
+    """Import a module, returning the ImportError instead of raising it."""
+    try:
+        importlib.import_module(module_name)
+    except ImportError as e:
+        return e
+    return None
 
 
 def test_imports() -> bool:
@@ -20,33 +34,36 @@ def test_imports() -> bool:
     # Test main modules
     try:
         import kfp_components  # type: ignore[import-not-found]  # noqa: F401
-        from kfp_components import components, pipelines  # type: ignore[import-not-found]  # noqa: F401
-
-        print("✓ Main modules imported successfully")
     except ImportError as e:
         print(f"✗ Failed to import main modules: {e}")
-        success = False
-        return success
+        return False
+
+    # Category imports are only attempted under asset packages that imported,
+    # so a broken parent is reported once rather than once per category.
+    kinds = []
+    for kind in ASSET_KINDS:
+        error = _try_import(f"kfp_components.{kind}")
+        if error is None:
+            kinds.append(kind)
+        else:
+            print(f"✗ Failed to import kfp_components.{kind}: {error}")
+            success = False
 
-    # Test category imports
-    categories = ["training", "evaluation", "data_processing", "deployment"]
+    if success:
+        print("✓ Main modules imported successfully")
 
-    for category in categories:
-        comp_module = f"kfp_components.components.{category}"
-        pipe_module = f"kfp_components.pipelines.{category}"
+    # Test category imports
+    modules = [f"kfp_components.{kind}.{category}" for category in CATEGORIES for kind in kinds]
 
-        try:
-            importlib.import_module(comp_module)
-            print(f"✓ {comp_module} imported successfully")
-        except ImportError as e:
-            print(f"✗ Failed to import {comp_module}: {e}")
-            success = False
+    # Imports are independent, so overlap their file system lookups; report in a stable order.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(modules)))) as executor:
+        errors = list(executor.map(_try_import, modules))
 
-        try:
-            importlib.import_module(pipe_module)
-            print(f"✓ {pipe_module} imported successfully")
-        except ImportError as e:
-            print(f"✗ Failed to import {pipe_module}: {e}")
+    for module_name, error in zip(modules, errors):
+        if error is None:
+            print(f"✓ {module_name} imported successfully")
+        else:
+            print(f"✗ Failed to import {module_name}: {error}")
             success = False
 
     if success:
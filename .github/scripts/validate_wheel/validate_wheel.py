@@ -6,22 +6,26 @@ metadata, and required files.
 """
 
 import argparse
+import itertools
 import sys
 import zipfile
 from pathlib import Path
 from typing import List, Tuple
 
+_BYTES_PER_MB = 1 << 20
+
 
 def validate_dist_info(file_list: List[str]) -> Tuple[List[str], List[str]]:
     """Validate the presence of .dist-info directory."""
     messages = []
     errors = []
 
-    dist_info_dirs = [f for f in file_list if ".dist-info/" in f]
-    if not dist_info_dirs:
+    # Only the first match is reported, so stop scanning once one is found.
+    first_dist_info = next((f for f in file_list if ".dist-info/" in f), None)
+    if first_dist_info is None:
         errors.append("Error: No .dist-info directory found")
     else:
-        messages.append(f"✓ Found .dist-info directory: {dist_info_dirs[0].split('/')[0]}")
+        messages.append(f"✓ Found .dist-info directory: {first_dist_info.split('/')[0]}")
 
     return messages, errors
 
@@ -159,11 +163,11 @@ def get_wheel_info(wheel_path: Path, file_list: List[str]) -> List[str]:
 
     # Report wheel size
     wheel_size = wheel_path.stat().st_size
-    messages.append(f"✓ Wheel size: {wheel_size / 1024 / 1024:.2f} MB")
+    messages.append(f"✓ Wheel size: {wheel_size / _BYTES_PER_MB:.2f} MB")
 
     # Show sample of contents
     messages.append("\nSample contents (first 10 non-metadata files):")
-    sample_files = [f for f in file_list if ".dist-info/" not in f][:10]
+    sample_files = itertools.islice((f for f in file_list if ".dist-info/" not in f), 10)
     for f in sample_files:
         messages.append(f"  - {f}")
 
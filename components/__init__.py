@@ -1,12 +1,27 @@
 """Kubeflow Pipelines Components - Core Components Package
 
-This module auto-imports all components for clean usage:
+Category subpackages are imported lazily on first access, so these all work
+without paying for categories that are never used:
     from kfp_components.components import training
     from kfp_components.components import evaluation
     from kfp_components.components import data_processing
     from kfp_components.components import deployment
 """
 
-from . import data_processing, deployment, evaluation, training
+import importlib
 
 __all__ = ["data_processing", "deployment", "evaluation", "training"]
+
+
+def __getattr__(name: str):
+    """Import a category subpackage the first time it is accessed (PEP 562)."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including category subpackages not yet imported."""
+    return sorted(set(globals()) | set(__all__))
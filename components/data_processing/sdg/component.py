@@ -8,8 +8,10 @@ import kfp.compiler
 from kfp import dsl
 
 
+# Only packages the component needs on every run. diskcache (for cache_dir) and
+# xxhash (for the flow cache) are optional and used when the image provides them.
 @dsl.component(
-    packages_to_install=["sdg-hub>=0.7.0,<1.0"],
+    packages_to_install=["sdg-hub==0.9.4", "pyarrow==26.0.0", "orjson==3.13.0", "pyyaml==6.0.3"],
 )
 def sdg(
     output_artifact: dsl.Output[dsl.Dataset],
@@ -19,7 +21,7 @@ def sdg(
     flow_id: str = "",
     flow_yaml_path: str = "",
     model: str = "",
-    max_concurrency: int = 10,
+    max_concurrency: int = -1,
     checkpoint_pvc_path: str = "",
     save_freq: int = 100,
     log_level: str = "INFO",
@@ -28,6 +30,11 @@ def sdg(
     export_to_pvc: bool = False,
     export_path: str = "",
     runtime_params: dict = None,
+    cache_dir: str = "",
+    enable_prompt_cache: bool = False,
+    validate_sample_size: int = 256,
+    dedup_inputs: bool = False,
+    checkpoint_local_tmp: bool = False,
 ):
     """Run an SDG Hub flow to generate synthetic data.
 
@@ -42,7 +49,7 @@ def sdg(
         flow_id: Built-in flow ID from the SDG Hub registry.
         flow_yaml_path: Path to a custom flow YAML file.
         model: LiteLLM model identifier (e.g. 'openai/gpt-4o-mini').
-        max_concurrency: Maximum concurrent LLM requests.
+        max_concurrency: Maximum concurrent LLM requests. Use -1 to size automatically for the endpoint.
         checkpoint_pvc_path: PVC path for checkpoints (enables resume).
         save_freq: Checkpoint save frequency (number of samples).
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR).
@@ -51,24 +58,45 @@ def sdg(
         export_to_pvc: Whether to export output to PVC (in addition to KFP artifact).
         export_path: Base PVC path for exports (required if export_to_pvc is True).
         runtime_params: Per-block parameter overrides as a dict of {block_name: {param: value}}.
+        cache_dir: PVC path for an LLM response cache (optional). Needs temperature between 0 and 0.3 and diskcache.
+        enable_prompt_cache: Mark system prompts as cacheable prefixes for providers that support it.
+        validate_sample_size: Rows to validate against the flow's schema. Use -1 to validate every row.
+        dedup_inputs: Generate once per distinct input row and reuse the result for its duplicates.
+        checkpoint_local_tmp: Write checkpoints to local disk and sync them to checkpoint_pvc_path in the background.
     """
+    import atexit
+    import contextlib
+    import datetime
+    import hashlib
+    import importlib.metadata
     import logging
+    import logging.handlers
     import os
+    import pickle
+    import queue
+    import shutil
+    import stat
+    import sys
+    import tempfile
+    import threading
     import time
 
-    import pandas as pd
-    from sdg_hub.core.flow.base import Flow
-    from sdg_hub.core.flow.registry import FlowRegistry
-    from sdg_hub.core.utils.error_handling import FlowValidationError
-
     # Configure logging
     log_level_value = getattr(logging, log_level.upper(), None)
     if log_level_value is None:
         log_level_value = logging.INFO
-    logging.basicConfig(
-        level=log_level_value,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-    )
+    if not logging.getLogger().handlers:
+        # Records are queued and written by a listener thread, so console writes
+        # (heavy at DEBUG with many concurrent LLM calls) never block generation.
+        log_queue = queue.SimpleQueue()
+        logging.basicConfig(
+            level=log_level_value,
+            format="%(asctime)s - %(levelname)s - %(message)s",
+            handlers=[logging.handlers.QueueHandler(log_queue)],
+        )
+        log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+        log_listener.start()
+        atexit.register(log_listener.stop)
     logger = logging.getLogger(__name__)
 
     start_time = time.time()
@@ -77,85 +105,240 @@ def sdg(
     logger.info("SDG Hub KFP Component")
     logger.info("=" * 60)
 
+    # LLM generation is I/O-bound, so throughput scales with concurrency up to the
+    # provider's rate limit. Self-hosted endpoints (e.g. vLLM) tolerate more.
+    if max_concurrency < 0:
+        if os.environ.get("SDG_MAX_CONCURRENCY"):
+            max_concurrency = int(os.environ["SDG_MAX_CONCURRENCY"])
+        elif model.startswith("hosted_vllm/") or os.environ.get("LLM_API_BASE"):
+            max_concurrency = 128
+        else:
+            max_concurrency = 64
+
     # Log configuration
-    logger.info(f"Input Artifact: {'Provided' if input_artifact else 'Not provided'}")
-    logger.info(f"Input PVC Path: {input_pvc_path or 'Not provided'}")
-    logger.info(f"Flow ID: {flow_id or 'Not provided'}")
-    logger.info(f"Flow YAML Path: {flow_yaml_path or 'Not provided'}")
-    logger.info(f"Model: {model or 'Not provided'}")
-    logger.info(f"Max Concurrency: {max_concurrency}")
-    logger.info(f"Temperature: {'flow default' if temperature < 0 else temperature}")
-    logger.info(f"Max Tokens: {'flow default' if max_tokens < 0 else max_tokens}")
-    logger.info(f"Export to PVC: {export_to_pvc}")
+    logger.info("Input Artifact: %s", "Provided" if input_artifact else "Not provided")
+    logger.info("Input PVC Path: %s", input_pvc_path or "Not provided")
+    logger.info("Flow ID: %s", flow_id or "Not provided")
+    logger.info("Flow YAML Path: %s", flow_yaml_path or "Not provided")
+    logger.info("Model: %s", model or "Not provided")
+    logger.info("Max Concurrency: %s", max_concurrency)
+    logger.info("Temperature: %s", "flow default" if temperature < 0 else temperature)
+    logger.info("Max Tokens: %s", "flow default" if max_tokens < 0 else max_tokens)
+    logger.info("Export to PVC: %s", export_to_pvc)
     if export_to_pvc:
-        logger.info(f"Export Path: {export_path or 'Not provided'}")
+        logger.info("Export Path: %s", export_path or "Not provided")
     runtime_params = runtime_params or {}
     if runtime_params:
-        logger.info(f"Runtime params: {runtime_params}")
+        logger.info("Runtime params: %s", runtime_params)
+    logger.info("LLM Cache Dir: %s", cache_dir or "Not provided")
+    logger.info("Prompt Cache: %s", enable_prompt_cache)
 
     # =========================================================================
-    # INPUT HANDLING
+    # ARGUMENT VALIDATION
     # =========================================================================
+    # Checked before importing pandas/pyarrow/sdg_hub so malformed arguments
+    # fail fast without paying for (or risking OOM on) the heavy module graph.
     if input_artifact:
-        logger.info(f"Loading input from KFP artifact: {input_artifact.path}")
-        if not os.path.exists(input_artifact.path):
-            raise FileNotFoundError(f"Input artifact file not found: {input_artifact.path}")
-        df = pd.read_json(input_artifact.path, lines=True)
-        logger.info("Using input_artifact as data source")
+        input_path = input_artifact.path
+        logger.info("Loading input from KFP artifact: %s", input_path)
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input artifact file not found: {input_path}")
+        input_source = "input_artifact"
     elif input_pvc_path:
-        logger.info(f"Loading input from PVC: {input_pvc_path}")
-        if not os.path.exists(input_pvc_path):
-            raise FileNotFoundError(f"Input file not found: {input_pvc_path}")
-        df = pd.read_json(input_pvc_path, lines=True)
-        logger.info("Using input_pvc_path as data source")
+        input_path = input_pvc_path
+        logger.info("Loading input from PVC: %s", input_path)
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        input_source = "input_pvc_path"
     else:
         raise ValueError("No input provided. Supply 'input_artifact' or 'input_pvc_path'.")
 
-    input_rows = len(df)
-    logger.info(f"Loaded {input_rows} rows with columns: {list(df.columns)}")
-
-    # =========================================================================
-    # FLOW SELECTION
-    # =========================================================================
     if not flow_id and not flow_yaml_path:
         raise ValueError(
             "Either 'flow_id' or 'flow_yaml_path' must be provided. "
             "Use 'flow_id' for built-in flows or 'flow_yaml_path' for custom YAML."
         )
 
+    if flow_yaml_path and not os.path.exists(flow_yaml_path):
+        raise FileNotFoundError(
+            f"Custom flow YAML not found: {flow_yaml_path}. Ensure the file is mounted (e.g., via ConfigMap or PVC)."
+        )
+
+    import numpy as np
+    import orjson
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.json as paj
+    import yaml
+    from sdg_hub.core.flow.base import Flow
+    from sdg_hub.core.flow.registry import FlowRegistry
+    from sdg_hub.core.utils.error_handling import FlowValidationError
+
+    # =========================================================================
+    # INPUT HANDLING
+    # =========================================================================
+    # Keep text columns Arrow-backed rather than object dtype: SDG inputs are
+    # string-heavy, and per-row Python str objects roughly double their footprint.
+    arrow_string_dtypes = {
+        pa.string(): pd.StringDtype("pyarrow"),
+        pa.large_string(): pd.StringDtype("pyarrow"),
+    }
+
+    def without_timestamps(arrow_type):
+        # Arrow infers ISO-looking strings as timestamps; flows expect the text as written.
+        if pa.types.is_timestamp(arrow_type):
+            return pa.string()
+        if pa.types.is_list(arrow_type):
+            return pa.list_(without_timestamps(arrow_type.value_type))
+        if pa.types.is_large_list(arrow_type):
+            return pa.large_list(without_timestamps(arrow_type.value_type))
+        if pa.types.is_struct(arrow_type):
+            return pa.struct([field.with_type(without_timestamps(field.type)) for field in arrow_type])
+        return arrow_type
+
+    def read_jsonl(path):
+        # Arrow's multithreaded C++ reader parses JSONL much faster than
+        # pd.read_json and with roughly half the peak memory.
+        read_options = paj.ReadOptions(block_size=16 << 20, use_threads=True)
+        table = paj.read_json(path, read_options=read_options)
+        schema = pa.schema([field.with_type(without_timestamps(field.type)) for field in table.schema])
+        if schema != table.schema:
+            parse_options = paj.ParseOptions(explicit_schema=schema)
+            table = paj.read_json(path, read_options=read_options, parse_options=parse_options)
+
+        # to_pandas turns nested values into numpy arrays; keep them as the plain
+        # lists and dicts pd.read_json produced.
+        columns = table.column_names
+        nested = {
+            name: table.column(name).to_pylist() for name in columns if pa.types.is_nested(schema.field(name).type)
+        }
+        num_rows = table.num_rows
+        table = table.drop_columns(list(nested))
+
+        # split_blocks skips consolidating columns into 2D blocks (a full copy) and
+        # self_destruct frees each Arrow column once converted, so the input is
+        # never held twice in memory.
+        if table.num_columns:
+            df = table.to_pandas(types_mapper=arrow_string_dtypes.get, split_blocks=True, self_destruct=True)
+        else:
+            df = pd.DataFrame(index=pd.RangeIndex(num_rows))
+        for name, values in nested.items():
+            df.insert(columns.index(name), name, pd.Series(values, index=df.index, dtype=object))
+        return df
+
+    df = read_jsonl(input_path)
+    logger.info("Using %s as data source", input_source)
+
+    input_rows = len(df)
+    logger.info("Loaded %d rows with columns: %s", input_rows, list(df.columns))
+
+    # =========================================================================
+    # FLOW SELECTION
+    # =========================================================================
     if flow_id and flow_yaml_path:
         logger.warning("Both 'flow_id' and 'flow_yaml_path' provided. Using 'flow_yaml_path' (takes precedence).")
 
     if flow_yaml_path:
         yaml_path = flow_yaml_path
-        logger.info(f"Using custom flow YAML: {yaml_path}")
-        if not os.path.exists(yaml_path):
-            raise FileNotFoundError(
-                f"Custom flow YAML not found: {yaml_path}. Ensure the file is mounted (e.g., via ConfigMap or PVC)."
-            )
+        logger.info("Using custom flow YAML: %s", yaml_path)
     else:
-        logger.info(f"Looking up built-in flow: {flow_id}")
+        logger.info("Looking up built-in flow: %s", flow_id)
         try:
             yaml_path = FlowRegistry.get_flow_path_safe(flow_id)
         except ValueError as exc:
             raise ValueError(f"Flow lookup failed for '{flow_id}': {exc}") from exc
-        logger.info(f"Found flow at: {yaml_path}")
+        logger.info("Found flow at: %s", yaml_path)
 
     # =========================================================================
     # FLOW LOADING
     # =========================================================================
-    logger.info(f"Loading flow from: {yaml_path}")
+    def flow_cache_key(path):
+        # xxh3 is a non-cryptographic hash and far cheaper than sha256 for this.
+        # xxhash is optional, so fall back to sha256 when it is not installed.
+        try:
+            import xxhash
+
+            key = xxhash.xxh3_64()
+        except ImportError:
+            key = hashlib.sha256()
+        # Pickles are only valid for the interpreter and SDG Hub release that wrote them.
+        key.update(f"python {sys.version_info[:3]} sdg-hub {importlib.metadata.version('sdg-hub')}\n".encode())
+        with open(path, "rb") as f:
+            flow_bytes = f.read()
+        key.update(flow_bytes)
+
+        # Hash the files the flow references (e.g. prompt_config_path) so editing a
+        # prompt invalidates the entry, without scanning the rest of the directory.
+        flow_dir = os.path.dirname(os.path.abspath(path))
+        pending = [yaml.safe_load(flow_bytes)]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, dict):
+                pending.extend(node.values())
+            elif isinstance(node, list):
+                pending.extend(node)
+            elif isinstance(node, str) and node and os.path.isfile(os.path.join(flow_dir, node)):
+                with open(os.path.join(flow_dir, node), "rb") as f:
+                    key.update(f"\n{node}\n".encode())
+                    key.update(f.read())
+        return key.hexdigest()
+
+    def load_flow(path):
+        if os.environ.get("SDG_FLOW_CACHE") != "1":
+            return Flow.from_yaml(path)
+
+        # Opt-in dev-loop cache: reruns of an unchanged flow skip YAML parsing and
+        # block construction. Unpickling runs arbitrary code, so entries are only
+        # read from a per-user directory nobody else can write to.
+        flow_cache_dir = os.path.join(tempfile.gettempdir(), f"sdg_flow_cache_{os.getuid()}")
+        os.makedirs(flow_cache_dir, mode=0o700, exist_ok=True)
+        flow_cache_stat = os.lstat(flow_cache_dir)
+        if (
+            not stat.S_ISDIR(flow_cache_stat.st_mode)
+            or flow_cache_stat.st_uid != os.getuid()
+            or flow_cache_stat.st_mode & 0o077
+        ):
+            logger.warning("Flow cache disabled: %s is not a private directory", flow_cache_dir)
+            return Flow.from_yaml(path)
+        cache_path = os.path.join(flow_cache_dir, f"{flow_cache_key(path)}.pkl")
+
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            logger.info("Loaded cached flow: %s", cache_path)
+            return cached
+        except Exception:
+            pass
+
+        loaded = Flow.from_yaml(path)
+        # Written under a temporary name and renamed, so a concurrent run never
+        # reads a partially written pickle.
+        fd, tmp_path = tempfile.mkstemp(dir=flow_cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(loaded, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as exc:
+            logger.debug("Flow not cached (%s); it will be parsed again next run", exc)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+        return loaded
+
+    logger.info("Loading flow from: %s", yaml_path)
     try:
-        flow = Flow.from_yaml(yaml_path)
+        flow = load_flow(yaml_path)
     except FlowValidationError as exc:
         raise FlowValidationError(f"Failed to load flow from '{yaml_path}': {exc}") from exc
 
-    logger.info(f"Flow loaded: '{flow.metadata.name}' v{flow.metadata.version} with {len(flow.blocks)} blocks")
+    logger.info("Flow loaded: '%s' v%s with %d blocks", flow.metadata.name, flow.metadata.version, len(flow.blocks))
 
     # =========================================================================
     # MODEL CONFIGURATION
     # =========================================================================
+    llm_cache_enabled = False
     if flow.is_model_config_required():
+        import litellm
+
         if not model:
             raise ValueError(
                 f"Flow '{flow.metadata.name}' contains LLM blocks and requires "
@@ -171,10 +354,16 @@ def sdg(
             model_kwargs["temperature"] = temperature
         if max_tokens > 0:
             model_kwargs["max_tokens"] = max_tokens
-
-        logger.info(f"Configuring model: {model}")
+        if enable_prompt_cache:
+            # Every row shares the same system prompt, so let LiteLLM tag it with
+            # cache_control and the provider reuses the prefix instead of
+            # reprocessing it per row. Sampling is unaffected; only the prompt
+            # prefix is cached. Providers without prompt caching ignore it.
+            model_kwargs["cache_control_injection_points"] = [{"location": "message", "role": "system"}]
+
+        logger.info("Configuring model: %s", model)
         if api_base:
-            logger.info(f"Using API base: {api_base}")
+            logger.info("Using API base: %s", api_base)
 
         flow.set_model_config(
             model=model,
@@ -183,50 +372,176 @@ def sdg(
             **model_kwargs,
         )
         logger.info("Model configuration applied to LLM blocks")
+
+        if cache_dir:
+            # Replaying cached responses for sampled generations would collapse
+            # the diversity the caller asked for, so only cache near-deterministic
+            # runs. The -1 sentinel defers to the flow's own (possibly high)
+            # temperature, so it does not qualify either.
+            if not 0 <= temperature <= 0.3:
+                logger.warning(
+                    "LLM response cache disabled: requires an explicit temperature between 0 and 0.3 (got %s)",
+                    "flow default" if temperature < 0 else temperature,
+                )
+            else:
+                try:
+                    # LiteLLM's disk cache is backed by diskcache, which is not installed by default.
+                    import diskcache  # noqa: F401
+                except ImportError:
+                    logger.warning("LLM response cache disabled: the diskcache package is not installed")
+                else:
+                    # Keyed by LiteLLM on model, messages and sampling params, so repeated
+                    # prompts across rows and pipeline runs skip the network round-trip.
+                    litellm.enable_cache(type="disk", disk_cache_dir=cache_dir)
+                    llm_cache_enabled = True
+                    logger.info("LLM response cache enabled: dir=%s", cache_dir)
     else:
         logger.info("Flow has no LLM blocks - skipping model configuration")
 
-    # =========================================================================
-    # DATASET VALIDATION
-    # =========================================================================
-    validation_errors = flow.validate_dataset(df)
-    if validation_errors:
-        raise FlowValidationError(
-            f"Dataset validation failed for flow '{flow.metadata.name}':\n"
-            + "\n".join(f"  - {err}" for err in validation_errors)
-        )
-    logger.info("Dataset validation passed")
-
-    # =========================================================================
-    # FLOW EXECUTION
-    # =========================================================================
-    logger.info(f"Starting flow execution: {len(df)} samples, max_concurrency={max_concurrency}")
-
-    generate_kwargs = {
-        "max_concurrency": max_concurrency,
-    }
-
-    if checkpoint_pvc_path:
-        generate_kwargs["checkpoint_dir"] = checkpoint_pvc_path
-        generate_kwargs["save_freq"] = save_freq
-        logger.info(f"Checkpointing enabled: dir={checkpoint_pvc_path}, save_freq={save_freq}")
-
-    if runtime_params:
-        generate_kwargs["runtime_params"] = runtime_params
-
-    output_df = flow.generate(df, **generate_kwargs)
+    # Everything from here to generate runs under the finally below, so a failed
+    # validation or checkpoint setup never leaves the process-global LLM cache on.
+    checkpoint_sync = None
+    try:
+        # =========================================================================
+        # DATASET VALIDATION
+        # =========================================================================
+        # All rows share the same columns, so schema checks on a sample catch the
+        # same problems as on the full input. Re-check the full dataset only when
+        # the sample fails, since checks like minimum sample counts need every row.
+        validation_df = df if validate_sample_size < 0 else df.head(validate_sample_size)
+        validation_errors = flow.validate_dataset(validation_df)
+        if validation_errors and len(validation_df) < len(df):
+            validation_errors = flow.validate_dataset(df)
+        if validation_errors:
+            raise FlowValidationError(
+                f"Dataset validation failed for flow '{flow.metadata.name}':\n"
+                + "\n".join(f"  - {err}" for err in validation_errors)
+            )
+        logger.info("Dataset validation passed")
+
+        # =========================================================================
+        # FLOW EXECUTION
+        # =========================================================================
+        # Duplicate input rows would each pay for the same LLM calls. Only the first
+        # of each is generated, and results are fanned back out to every duplicate by
+        # position afterwards, so the flow sees exactly the input columns. Reusing one
+        # sample per prompt only makes sense for near-deterministic runs, hence opt-in.
+        dedup_codes = None
+        if dedup_inputs:
+            try:
+                row_keys = pd.util.hash_pandas_object(df, index=False)
+            except TypeError as exc:
+                logger.warning("Input dedup skipped: rows are not hashable (%s)", exc)
+            else:
+                # factorize numbers rows by first appearance, so code i is the i-th unique row.
+                codes, uniques = pd.factorize(row_keys)
+                if len(uniques) < len(df):
+                    logger.info("Deduplicated input: %d unique of %d rows", len(uniques), len(df))
+                    df = df[~row_keys.duplicated().to_numpy()]
+                    dedup_codes = codes
+
+        logger.info("Starting flow execution: %d samples, max_concurrency=%s", len(df), max_concurrency)
+
+        generate_kwargs = {
+            "max_concurrency": max_concurrency,
+        }
+
+        def sync_checkpoints(src, dst, synced):
+            # Copy new or changed checkpoint files, replacing atomically so a pod kill
+            # mid-copy never leaves a truncated checkpoint on the PVC.
+            os.makedirs(dst, exist_ok=True)
+            with os.scandir(src) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    signature = (st.st_mtime_ns, st.st_size)
+                    if synced.get(entry.name) == signature:
+                        continue
+                    tmp_path = os.path.join(dst, f".{entry.name}.tmp")
+                    shutil.copyfile(entry.path, tmp_path)
+                    os.replace(tmp_path, os.path.join(dst, entry.name))
+                    synced[entry.name] = signature
+
+        if checkpoint_pvc_path:
+            checkpoint_dir = checkpoint_pvc_path
+            if checkpoint_local_tmp:
+                # Checkpoint flushes happen on the generation loop; on PVC-backed block
+                # storage each one stalls in-flight LLM calls. Flush to local disk and
+                # let a background thread ship the files to the PVC instead.
+                checkpoint_dir = tempfile.mkdtemp(prefix="sdg_checkpoints_")
+                if os.path.isdir(checkpoint_pvc_path):
+                    shutil.copytree(checkpoint_pvc_path, checkpoint_dir, dirs_exist_ok=True)
+                # Files seeded from the PVC are already there; only ship what changes.
+                synced = {
+                    entry.name: (entry.stat().st_mtime_ns, entry.stat().st_size)
+                    for entry in os.scandir(checkpoint_dir)
+                    if entry.is_file()
+                }
+                stop_sync = threading.Event()
+
+                def sync_loop():
+                    while not stop_sync.wait(30):
+                        try:
+                            sync_checkpoints(checkpoint_dir, checkpoint_pvc_path, synced)
+                        except OSError as exc:
+                            logger.warning("Checkpoint sync to %s failed: %s", checkpoint_pvc_path, exc)
+
+                sync_thread = threading.Thread(target=sync_loop, name="checkpoint-sync", daemon=True)
+                sync_thread.start()
+                checkpoint_sync = (stop_sync, sync_thread, synced)
+            generate_kwargs["checkpoint_dir"] = checkpoint_dir
+            generate_kwargs["save_freq"] = save_freq
+            logger.info("Checkpointing enabled: dir=%s, save_freq=%s", checkpoint_dir, save_freq)
+
+        if runtime_params:
+            generate_kwargs["runtime_params"] = runtime_params
+
+        # generate() already submits each LLM block's requests concurrently on its
+        # own event loop, bounded by max_concurrency, so no extra async wrapper is
+        # needed here; throughput is tuned through max_concurrency alone.
+        output_df = flow.generate(df, **generate_kwargs)
+    finally:
+        if llm_cache_enabled:
+            # enable_cache is process-global; don't leave it on for later callers.
+            litellm.disable_cache()
+        if checkpoint_sync is not None:
+            stop_sync, sync_thread, synced = checkpoint_sync
+            stop_sync.set()
+            sync_thread.join()
+            # A sync failure must not mask a generation error; the local copy is
+            # kept so the checkpoints are not lost with it.
+            try:
+                sync_checkpoints(checkpoint_dir, checkpoint_pvc_path, synced)
+            except OSError as exc:
+                logger.warning(
+                    "Final checkpoint sync to %s failed, local checkpoints kept in %s: %s",
+                    checkpoint_pvc_path,
+                    checkpoint_dir,
+                    exc,
+                )
+            else:
+                logger.info("Checkpoints synced to PVC: %s", checkpoint_pvc_path)
+                shutil.rmtree(checkpoint_dir, ignore_errors=True)
+    if dedup_codes is not None:
+        if len(output_df) == len(df):
+            output_df = output_df.iloc[dedup_codes].reset_index(drop=True)
+        else:
+            # Rows can only be matched back by position; a flow that filters or
+            # expands rows breaks that, so keep its output for the unique rows.
+            logger.warning(
+                "Input dedup: flow returned %d rows for %d unique inputs, so duplicates were not expanded",
+                len(output_df),
+                len(df),
+            )
     output_rows = len(output_df)
+    # The input frame is no longer needed; release it before writing output.
+    del df
 
     # =========================================================================
-    # OUTPUT HANDLING
-    # =========================================================================
-    output_df.to_json(output_artifact.path, orient="records", lines=True)
-    logger.info(f"Output written to: {output_artifact.path}")
-    logger.info(f"Output: {output_rows} rows with columns: {list(output_df.columns)}")
-
-    # =========================================================================
-    # PVC EXPORT (OPTIONAL)
+    # PVC EXPORT TARGET (OPTIONAL)
     # =========================================================================
+    export_file_path = None
     if export_to_pvc:
         if not export_path:
             raise ValueError(
@@ -246,8 +561,48 @@ def sdg(
         os.makedirs(export_dir, exist_ok=True)
         export_file_path = os.path.join(export_dir, "generated.jsonl")
 
-        output_df.to_json(export_file_path, orient="records", lines=True)
-        logger.info(f"Output exported to PVC: {export_file_path}")
+    # =========================================================================
+    # OUTPUT HANDLING
+    # =========================================================================
+    # orjson encodes records in C and emits bytes directly, which is several
+    # times faster than DataFrame.to_json for large generated datasets.
+    # Rows are encoded one at a time rather than via to_dict(orient="records"),
+    # which would hold a second, dict-per-row copy of the dataset in memory.
+    # Each encoded row goes to every destination in the same pass, so the PVC
+    # export costs no second serialization or read-back of the artifact.
+    # JSON keys must be strings; flows can return other column labels (e.g. ints),
+    # which DataFrame.to_json wrote as their str() form.
+    columns = [str(column) for column in output_df.columns]
+
+    def encode_default(value):
+        # Missing values in Arrow-backed string columns surface as pd.NA. Flows can
+        # also hand back object arrays, numpy scalars and pd.Timestamp values, none
+        # of which orjson serializes natively.
+        if value is pd.NA or value is pd.NaT:
+            return None
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+    with contextlib.ExitStack() as stack:
+        destinations = [output_artifact.path] + ([export_file_path] if export_file_path else [])
+        writers = [stack.enter_context(open(path, "wb")).write for path in destinations]
+        for row in output_df.itertuples(index=False, name=None):
+            line = orjson.dumps(
+                dict(zip(columns, row)),
+                default=encode_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+            )
+            for write in writers:
+                write(line)
+    logger.info("Output written to: %s", output_artifact.path)
+    logger.info("Output: %d rows with columns: %s", output_rows, list(output_df.columns))
+    if export_file_path:
+        logger.info("Output exported to PVC: %s", export_file_path)
 
     # Write metrics
     execution_time = time.time() - start_time
@@ -257,7 +612,7 @@ def sdg(
     logger.info("Metrics logged")
 
     logger.info("=" * 60)
-    logger.info(f"SDG Hub KFP Component completed in {execution_time:.2f}s")
+    logger.info("SDG Hub KFP Component completed in %.2fs", execution_time)
     logger.info("=" * 60)
 
 
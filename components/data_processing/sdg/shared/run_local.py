@@ -6,7 +6,7 @@ raises 'Input artifacts are not yet supported for local execution'
 even when the artifact is not provided.
 """
 
-import json
+import itertools
 import os
 import sys
 import tempfile
@@ -17,6 +17,7 @@ if _COMPONENT_DIR not in sys.path:
     sys.path.insert(0, _COMPONENT_DIR)
 
 import kfp.local  # noqa: E402
+import orjson  # noqa: E402
 import pandas as pd  # noqa: E402
 from component import sdg  # noqa: E402
 from kfp.local import executor_input_utils, task_dispatcher  # noqa: E402
@@ -26,6 +27,9 @@ TEST_DATA = os.path.join(_COMPONENT_DIR, "tests", "test_data")
 INPUT_PATH = os.path.abspath(os.path.join(TEST_DATA, "sample_input.jsonl"))
 FLOW_PATH = os.path.abspath(os.path.join(TEST_DATA, "llm_test_flow.yaml"))
 
+# Only the head of the generated output is shown, so only that much is parsed.
+PREVIEW_ROWS = 20
+
 
 def _patched_construct_executor_input(component_spec, arguments, task_root, block_input_artifact):
     """Wrap construct_executor_input to skip the input artifact block.
@@ -60,6 +64,8 @@ def _patched_run(*args, **kwargs):
 
 def main():
     """Run the SDG component with LLM test flow via patched LocalRunner."""
+    # Reuse the parsed flow across local reruns; the component subprocess inherits this.
+    os.environ.setdefault("SDG_FLOW_CACHE", "1")
     executor_input_utils.construct_executor_input = _patched_construct_executor_input
     task_dispatcher.run_single_task_implementation = _patched_run
 
@@ -89,7 +95,8 @@ def main():
         print("\n" + "=" * 60)
         print("GENERATED OUTPUT")
         print("=" * 60)
-        df = pd.read_json(output_path, lines=True)
+        with open(output_path, "rb") as f:
+            df = pd.DataFrame([orjson.loads(line) for line in itertools.islice(f, PREVIEW_ROWS)])
         pd.set_option("display.max_colwidth", 80)
         pd.set_option("display.width", 200)
         print(df.to_string(index=False))
@@ -97,8 +104,8 @@ def main():
         print("\n" + "=" * 60)
         print("METRICS")
         print("=" * 60)
-        with open(metrics_path) as f:
-            print(json.dumps(json.load(f), indent=2))
+        with open(metrics_path, "rb") as f:
+            print(orjson.dumps(orjson.loads(f.read()), option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 """Local runner tests for the sdg_hub component."""
 
 import os
-import tempfile
 
-import pandas as pd
+import pyarrow.json as paj
 import pytest
+from sdg_hub.core.utils.error_handling import FlowValidationError
 
 from ..component import sdg
 
@@ -13,6 +13,9 @@ TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "test_data")
 TEST_INPUT_PATH = os.path.join(TEST_DATA_DIR, "sample_input.jsonl")
 TEST_FLOW_PATH = os.path.join(TEST_DATA_DIR, "transform_test_flow.yaml")
 LLM_TEST_FLOW_PATH = os.path.join(TEST_DATA_DIR, "llm_test_flow.yaml")
+TEST_INPUT_ABS = os.path.abspath(TEST_INPUT_PATH)
+TEST_FLOW_ABS = os.path.abspath(TEST_FLOW_PATH)
+LLM_TEST_FLOW_ABS = os.path.abspath(LLM_TEST_FLOW_PATH)
 
 
 class MockArtifact:
@@ -28,10 +31,61 @@ class MockArtifact:
         self.metadata[metric] = value
 
 
+@pytest.fixture(scope="module")
+def transform_flow_artifacts(tmp_path_factory):
+    """Run the transform-only flow once and share its artifacts across the module."""
+    tmp_dir = tmp_path_factory.mktemp("transform_flow")
+    output_artifact = MockArtifact(str(tmp_dir / "output.jsonl"))
+    output_metrics = MockArtifact(str(tmp_dir / "metrics.json"))
+
+    sdg.python_func(
+        output_artifact=output_artifact,
+        output_metrics=output_metrics,
+        input_pvc_path=TEST_INPUT_ABS,
+        flow_yaml_path=TEST_FLOW_ABS,
+        max_concurrency=1,
+        checkpoint_pvc_path="",
+        save_freq=100,
+        log_level="INFO",
+        temperature=0.7,
+        max_tokens=2048,
+        export_to_pvc=False,
+        export_path="",
+    )
+    return output_artifact, output_metrics
+
+
+@pytest.fixture(scope="module")
+def llm_flow_artifacts(tmp_path_factory):
+    """Run the LLM flow once against the real API and share its artifacts across the module.
+
+    The sample input has 3 rows, so max_concurrency=3 issues all completions at
+    once: the same token spend as a serial run, at roughly one request's latency.
+    """
+    tmp_dir = tmp_path_factory.mktemp("llm_flow")
+    output_artifact = MockArtifact(str(tmp_dir / "output.jsonl"))
+    output_metrics = MockArtifact(str(tmp_dir / "metrics.json"))
+
+    sdg.python_func(
+        output_artifact=output_artifact,
+        output_metrics=output_metrics,
+        input_pvc_path=TEST_INPUT_ABS,
+        flow_yaml_path=LLM_TEST_FLOW_ABS,
+        model="openai/gpt-4o-mini",
+        max_concurrency=3,  # One in-flight request per sample row
+        temperature=0.7,
+        max_tokens=2048,
+        checkpoint_pvc_path="",
+        save_freq=100,
+        log_level="INFO",
+    )
+    return output_artifact, output_metrics
+
+
 class TestSdgHubLocalRunner:
     """Test component with real flow execution (no LLM)."""
 
-    def test_local_execution_with_transform_flow(self, setup_and_teardown_subprocess_runner):
+    def test_local_execution_with_transform_flow(self, setup_and_teardown_subprocess_runner, transform_flow_artifacts):
         """Test component execution with a transform-only flow.
 
         This test accepts the ``setup_and_teardown_subprocess_runner`` fixture
@@ -42,35 +96,19 @@ class TestSdgHubLocalRunner:
         which are present in the sdg component signature, and attempting to
         run the component via the runner raises
         ``ValueError: Input artifacts are not yet supported for local execution``.
+        The flow itself runs once in the ``transform_flow_artifacts`` fixture.
         """
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_artifact = MockArtifact(os.path.join(tmp_dir, "output.jsonl"))
-            output_metrics = MockArtifact(os.path.join(tmp_dir, "metrics.json"))
+        output_artifact, output_metrics = transform_flow_artifacts
 
-            sdg.python_func(
-                output_artifact=output_artifact,
-                output_metrics=output_metrics,
-                input_pvc_path=os.path.abspath(TEST_INPUT_PATH),
-                flow_yaml_path=os.path.abspath(TEST_FLOW_PATH),
-                max_concurrency=1,
-                checkpoint_pvc_path="",
-                save_freq=100,
-                log_level="INFO",
-                temperature=0.7,
-                max_tokens=2048,
-                export_to_pvc=False,
-                export_path="",
-            )
+        # Validate output
+        assert os.path.exists(output_artifact.path), "Output artifact not created"
+        table = paj.read_json(output_artifact.path)
+        assert table.num_rows == 3, "Expected 3 output rows"
+        assert "document" in table.column_names
+        assert "domain" in table.column_names
 
-            # Validate output
-            assert os.path.exists(output_artifact.path), "Output artifact not created"
-            output_df = pd.read_json(output_artifact.path, lines=True)
-            assert len(output_df) == 3, "Expected 3 output rows"
-            assert "document" in output_df.columns
-            assert "domain" in output_df.columns
-
-            # Validate metrics
-            assert set(output_metrics.metadata.keys()) == {"input_rows", "output_rows", "execution_time_seconds"}
+        # Validate metrics
+        assert output_metrics.metadata.keys() == {"input_rows", "output_rows", "execution_time_seconds"}
 
 
 @pytest.mark.skipif(not os.environ.get("LLM_API_KEY"), reason="LLM_API_KEY not set - skipping LLM E2E test")
@@ -82,7 +120,8 @@ class TestSdgHubLLMFlow:
     to avoid test failures in environments without API access.
     """
 
-    def test_llm_flow_execution(self):
+    @pytest.mark.xdist_group(name="llm_api")
+    def test_llm_flow_execution(self, llm_flow_artifacts):
         """Test that the component can run an LLM flow with real API.
 
         This is an end-to-end test that:
@@ -91,98 +130,67 @@ class TestSdgHubLLMFlow:
         - Validates output contains LLM-generated content
         - Verifies metrics are produced correctly
 
-        Uses max_concurrency=1 to minimize API costs during testing.
+        The API run happens once in the ``llm_flow_artifacts`` fixture.
+        """
+        output_artifact, output_metrics = llm_flow_artifacts
+
+        # Validate output artifact exists and has content
+        assert os.path.exists(output_artifact.path), "Output artifact file not created"
+        table = paj.read_json(output_artifact.path)
+        assert table.num_rows > 0, "Output is empty"
+
+        # Validate LLM blocks added generated content
+        assert "extract_question_content" in table.column_names, "LLM flow did not produce extracted content"
+
+        # Validate questions were actually generated (not null/empty)
+        generated = table.column("extract_question_content").to_pylist()
+        assert all(isinstance(s, str) and s for s in generated), "Some generated content is missing or empty"
+
+        # Validate original columns are preserved
+        assert "document" in table.column_names, "Original 'document' column missing"
+        assert "domain" in table.column_names, "Original 'domain' column missing"
+
+        # Validate metrics
+        expected_metrics = {"input_rows", "output_rows", "execution_time_seconds"}
+        assert output_metrics.metadata.keys() == expected_metrics
+        assert output_metrics.metadata["input_rows"] == 3, "Expected 3 input rows"
+        assert output_metrics.metadata["output_rows"] == 3, "Expected 3 output rows"
+        assert output_metrics.metadata["execution_time_seconds"] > 0, "Execution time should be positive"
+
+
+class TestSdgHubLLMFlowErrors:
+    """Error paths for LLM flows, run without real API calls."""
+
+    @pytest.mark.parametrize(
+        "model, exc, match",
+        [
+            ("invalid/nonexistent-model-xyz", FlowValidationError, "LLM Provider NOT provided"),
+            ("", ValueError, "requires a 'model' parameter"),
+        ],
+        ids=["invalid_model", "missing_model"],
+    )
+    def test_llm_flow_model_errors(self, model, exc, match, tmp_path):
+        """Test that LLM flows fail cleanly for a bad or missing model parameter.
+
+        LiteLLM rejects a model string without a known provider before making
+        any request, and SDG Hub wraps that error in a FlowValidationError for the
+        failing block. The missing-model case is rejected by the component before
+        any LLM block runs.
         """
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Create mock KFP artifacts
-            output_artifact = MockArtifact(os.path.join(tmp_dir, "output.jsonl"))
-            output_metrics = MockArtifact(os.path.join(tmp_dir, "metrics.json"))
+        output_artifact = MockArtifact(str(tmp_path / "output.jsonl"))
+        output_metrics = MockArtifact(str(tmp_path / "metrics.json"))
 
-            # Execute component with LLM flow
+        with pytest.raises(exc, match=match):
             sdg.python_func(
                 output_artifact=output_artifact,
                 output_metrics=output_metrics,
-                input_pvc_path=os.path.abspath(TEST_INPUT_PATH),
-                flow_yaml_path=os.path.abspath(LLM_TEST_FLOW_PATH),
-                model="openai/gpt-4o-mini",
-                max_concurrency=1,  # Minimize API costs
+                input_pvc_path=TEST_INPUT_ABS,
+                flow_yaml_path=LLM_TEST_FLOW_ABS,
+                model=model,
+                max_concurrency=1,
                 temperature=0.7,
                 max_tokens=2048,
                 checkpoint_pvc_path="",
                 save_freq=100,
                 log_level="INFO",
             )
-
-            # Validate output artifact exists and has content
-            assert os.path.exists(output_artifact.path), "Output artifact file not created"
-            output_df = pd.read_json(output_artifact.path, lines=True)
-            assert len(output_df) > 0, "Output dataframe is empty"
-
-            # Validate LLM blocks added generated content
-            assert "extract_question_content" in output_df.columns, "LLM flow did not produce extracted content"
-
-            # Validate questions were actually generated (not null/empty)
-            assert output_df["extract_question_content"].notna().all(), "Some generated content is null"
-            assert (output_df["extract_question_content"].str.len() > 0).all(), "Some generated content is empty"
-
-            # Validate original columns are preserved
-            assert "document" in output_df.columns, "Original 'document' column missing"
-            assert "domain" in output_df.columns, "Original 'domain' column missing"
-
-            # Validate metrics
-            expected_metrics = {"input_rows", "output_rows", "execution_time_seconds"}
-            assert set(output_metrics.metadata.keys()) == expected_metrics
-            assert output_metrics.metadata["input_rows"] == 3, "Expected 3 input rows"
-            assert output_metrics.metadata["output_rows"] == 3, "Expected 3 output rows"
-            assert output_metrics.metadata["execution_time_seconds"] > 0, "Execution time should be positive"
-
-    def test_llm_flow_with_invalid_model_raises_error(self):
-        """Test that using an invalid model identifier raises an appropriate error.
-
-        This validates error handling for misconfigured model parameters.
-        """
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_artifact = MockArtifact(os.path.join(tmp_dir, "output.jsonl"))
-            output_metrics = MockArtifact(os.path.join(tmp_dir, "metrics.json"))
-
-            # Attempt to run with an invalid model identifier
-            with pytest.raises((ValueError, RuntimeError)):  # SDG Hub raises for invalid models
-                sdg.python_func(
-                    output_artifact=output_artifact,
-                    output_metrics=output_metrics,
-                    input_pvc_path=os.path.abspath(TEST_INPUT_PATH),
-                    flow_yaml_path=os.path.abspath(LLM_TEST_FLOW_PATH),
-                    model="invalid/nonexistent-model-xyz",
-                    max_concurrency=1,
-                    temperature=0.7,
-                    max_tokens=2048,
-                    checkpoint_pvc_path="",
-                    save_freq=100,
-                    log_level="INFO",
-                )
-
-    def test_llm_flow_without_model_parameter_raises_error(self):
-        """Test that LLM flows without a model parameter raise ValueError.
-
-        This validates the component properly enforces model requirements
-        for flows containing LLM blocks.
-        """
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            output_artifact = MockArtifact(os.path.join(tmp_dir, "output.jsonl"))
-            output_metrics = MockArtifact(os.path.join(tmp_dir, "metrics.json"))
-
-            # Attempt to run LLM flow without model parameter
-            with pytest.raises(ValueError, match="requires a 'model' parameter"):
-                sdg.python_func(
-                    output_artifact=output_artifact,
-                    output_metrics=output_metrics,
-                    input_pvc_path=os.path.abspath(TEST_INPUT_PATH),
-                    flow_yaml_path=os.path.abspath(LLM_TEST_FLOW_PATH),
-                    model="",  # Empty model string
-                    max_concurrency=1,
-                    temperature=0.7,
-                    max_tokens=2048,
-                    checkpoint_pvc_path="",
-                    save_freq=100,
-                    log_level="INFO",
-                )
@@ -1,9 +1,12 @@
 """Unit tests for the sdg_hub component."""
 
 import os
+import shutil
 import tempfile
+import types
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -71,6 +74,27 @@ def _make_mock_flow(return_df=None):
     return mock_flow
 
 
+class _PicklableFlow:
+    """Minimal pass-through flow that, unlike a MagicMock, survives pickling."""
+
+    def __init__(self):
+        """Initialize metadata and an empty block list."""
+        self.metadata = types.SimpleNamespace(name="pickled-flow", version="1.0.0")
+        self.blocks = []
+
+    def is_model_config_required(self):
+        """Report that no model configuration is needed."""
+        return False
+
+    def validate_dataset(self, df):
+        """Accept any dataset."""
+        return []
+
+    def generate(self, df, **kwargs):
+        """Return the input unchanged."""
+        return df.copy()
+
+
 def _call_sdg(output_artifact, output_metrics, **kwargs):
     """Helper to call the component's python_func with defaults."""
     defaults = {
@@ -88,6 +112,11 @@ def _call_sdg(output_artifact, output_metrics, **kwargs):
         "export_to_pvc": False,
         "export_path": "",
         "runtime_params": None,
+        "cache_dir": "",
+        "enable_prompt_cache": False,
+        "validate_sample_size": 256,
+        "dedup_inputs": False,
+        "checkpoint_local_tmp": False,
     }
     defaults.update(kwargs)
     sdg.python_func(
@@ -122,6 +151,51 @@ class TestInputHandling:
         assert len(result) == 3
         assert list(result.columns) == ["document", "domain"]
 
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_string_columns_are_arrow_backed(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, tmp_dir
+    ):
+        """Test that text columns load as Arrow strings and missing values round-trip as null."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_from_yaml.return_value = _make_mock_flow()
+        input_path = os.path.join(tmp_dir, "input.jsonl")
+        with open(input_path, "w") as f:
+            f.write('{"document": "Doc one.", "domain": "science"}\n{"document": "Doc two.", "domain": null}\n')
+
+        _call_sdg(output_artifact, output_metrics, input_pvc_path=input_path, flow_id="test-flow")
+
+        generated_from = mock_from_yaml.return_value.generate.call_args.args[0]
+        assert generated_from["document"].dtype == pd.StringDtype("pyarrow")
+        with open(output_artifact.path) as f:
+            assert f.read().splitlines()[1] == '{"document":"Doc two.","domain":null}'
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_nested_and_date_like_columns_round_trip(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, tmp_dir
+    ):
+        """Test that list, struct and ISO-date-like string columns reach the flow and output unchanged."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_from_yaml.return_value = _make_mock_flow()
+        input_path = os.path.join(tmp_dir, "input.jsonl")
+        lines = [
+            '{"tags":["a","b"],"created":"2024-01-02T03:04:05","meta":{"seen":"2024-01-02","ids":[1,2]}}',
+            '{"tags":[],"created":"2024-02-03T04:05:06","meta":{"seen":"2024-02-03","ids":[]}}',
+        ]
+        with open(input_path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+        _call_sdg(output_artifact, output_metrics, input_pvc_path=input_path, flow_id="test-flow")
+
+        generated_from = mock_from_yaml.return_value.generate.call_args.args[0]
+        assert list(generated_from.columns) == ["tags", "created", "meta"]
+        assert generated_from["tags"].iloc[0] == ["a", "b"]
+        assert generated_from["created"].iloc[0] == "2024-01-02T03:04:05"
+        assert generated_from["meta"].iloc[0] == {"seen": "2024-01-02", "ids": [1, 2]}
+        with open(output_artifact.path) as f:
+            assert f.read().splitlines() == lines
+
     def test_missing_input_file_raises(self, output_artifact, output_metrics):
         """Test that missing input file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError, match="Input file not found"):
@@ -260,6 +334,68 @@ class TestFlowSelection:
         )
         mock_from_yaml.assert_called_once_with(yaml_path)
 
+    @mock.patch.dict(os.environ, {"SDG_FLOW_CACHE": "1"})
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    def test_flow_cache_reuses_parsed_flow(
+        self, mock_from_yaml, output_artifact, output_metrics, sample_input_file, tmp_dir
+    ):
+        """Test that SDG_FLOW_CACHE=1 parses an unchanged flow YAML only once."""
+        flow_dir = os.path.join(tmp_dir, "flows")
+        os.makedirs(flow_dir)
+        flow_yaml = os.path.join(flow_dir, "flow.yaml")
+        with open(flow_yaml, "w") as f:
+            f.write("metadata:\n  name: pickled-flow\n")
+        mock_from_yaml.return_value = _PicklableFlow()
+
+        with mock.patch("tempfile.tempdir", tmp_dir):
+            for _ in range(2):
+                _call_sdg(output_artifact, output_metrics, input_pvc_path=sample_input_file, flow_yaml_path=flow_yaml)
+
+        mock_from_yaml.assert_called_once_with(flow_yaml)
+        cache_dir = os.path.join(tmp_dir, f"sdg_flow_cache_{os.getuid()}")
+        assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    def test_flow_cache_invalidated_by_referenced_prompt(
+        self, mock_from_yaml, output_artifact, output_metrics, sample_input_file, tmp_dir
+    ):
+        """Test that editing a prompt file the flow references invalidates the cached flow."""
+        flow_dir = os.path.join(tmp_dir, "flows")
+        os.makedirs(flow_dir)
+        flow_yaml = os.path.join(flow_dir, "flow.yaml")
+        prompt = os.path.join(flow_dir, "prompt.yaml")
+        with open(flow_yaml, "w") as f:
+            f.write("blocks:\n  - block_config:\n      prompt_config_path: prompt.yaml\n")
+        mock_from_yaml.side_effect = lambda path: _PicklableFlow()
+
+        with mock.patch("tempfile.tempdir", tmp_dir):
+            for text in ("first", "second"):
+                with open(prompt, "w") as f:
+                    f.write(text)
+                _call_sdg(output_artifact, output_metrics, input_pvc_path=sample_input_file, flow_yaml_path=flow_yaml)
+
+        assert mock_from_yaml.call_count == 2
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    def test_flow_cache_skips_shared_directory(
+        self, mock_from_yaml, output_artifact, output_metrics, sample_input_file, tmp_dir
+    ):
+        """Test that the flow cache is not used when its directory is writable by other users."""
+        flow_yaml = os.path.join(tmp_dir, "flow.yaml")
+        with open(flow_yaml, "w") as f:
+            f.write("metadata:\n  name: pickled-flow\n")
+        cache_dir = os.path.join(tmp_dir, f"sdg_flow_cache_{os.getuid()}")
+        os.makedirs(cache_dir)
+        os.chmod(cache_dir, 0o777)
+        mock_from_yaml.side_effect = lambda path: _PicklableFlow()
+
+        with mock.patch("tempfile.tempdir", tmp_dir):
+            for _ in range(2):
+                _call_sdg(output_artifact, output_metrics, input_pvc_path=sample_input_file, flow_yaml_path=flow_yaml)
+
+        assert mock_from_yaml.call_count == 2
+        assert os.listdir(cache_dir) == []
+
 
 class TestModelConfiguration:
     """Tests for model configuration logic."""
@@ -365,6 +501,206 @@ class TestModelConfiguration:
         assert call_kwargs["model"] == "openai/gpt-4o-mini"
         assert "temperature" not in call_kwargs
         assert "max_tokens" not in call_kwargs
+        assert "cache_control_injection_points" not in call_kwargs
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_prompt_cache_injects_cache_control(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, sample_input_file
+    ):
+        """Test that enable_prompt_cache marks system prompts for provider prompt caching."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_flow.is_model_config_required.return_value = True
+        mock_from_yaml.return_value = mock_flow
+
+        _call_sdg(
+            output_artifact,
+            output_metrics,
+            input_pvc_path=sample_input_file,
+            flow_id="llm-flow",
+            model="openai/gpt-4o-mini",
+            enable_prompt_cache=True,
+        )
+
+        call_kwargs = mock_flow.set_model_config.call_args.kwargs
+        assert call_kwargs["cache_control_injection_points"] == [{"location": "message", "role": "system"}]
+
+    @mock.patch("litellm.disable_cache")
+    @mock.patch("litellm.enable_cache")
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_cache_dir_enables_disk_cache(
+        self,
+        mock_get_path,
+        mock_from_yaml,
+        mock_enable_cache,
+        mock_disable_cache,
+        output_artifact,
+        output_metrics,
+        sample_input_file,
+    ):
+        """Test that cache_dir enables LiteLLM's disk cache for LLM flows."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_flow.is_model_config_required.return_value = True
+        mock_from_yaml.return_value = mock_flow
+
+        _call_sdg(
+            output_artifact,
+            output_metrics,
+            input_pvc_path=sample_input_file,
+            flow_id="llm-flow",
+            model="openai/gpt-4o-mini",
+            temperature=0.0,
+            cache_dir="/mnt/cache/",
+        )
+
+        mock_enable_cache.assert_called_once_with(type="disk", disk_cache_dir="/mnt/cache/")
+        mock_disable_cache.assert_called_once_with()
+
+    @mock.patch("litellm.disable_cache")
+    @mock.patch("litellm.enable_cache")
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_cache_disabled_when_validation_fails(
+        self,
+        mock_get_path,
+        mock_from_yaml,
+        mock_enable_cache,
+        mock_disable_cache,
+        output_artifact,
+        output_metrics,
+        sample_input_file,
+    ):
+        """Test that the disk cache is turned off again when dataset validation fails."""
+        from sdg_hub.core.utils.error_handling import FlowValidationError
+
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_flow.is_model_config_required.return_value = True
+        mock_flow.validate_dataset.return_value = ["Missing required column: document"]
+        mock_from_yaml.return_value = mock_flow
+
+        with pytest.raises(FlowValidationError, match="Dataset validation failed"):
+            _call_sdg(
+                output_artifact,
+                output_metrics,
+                input_pvc_path=sample_input_file,
+                flow_id="llm-flow",
+                model="openai/gpt-4o-mini",
+                temperature=0.0,
+                cache_dir="/mnt/cache/",
+            )
+
+        mock_enable_cache.assert_called_once_with(type="disk", disk_cache_dir="/mnt/cache/")
+        mock_disable_cache.assert_called_once_with()
+        mock_flow.generate.assert_not_called()
+
+    @mock.patch.dict("sys.modules", {"diskcache": None})
+    @mock.patch("litellm.enable_cache")
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_cache_dir_skipped_without_diskcache(
+        self, mock_get_path, mock_from_yaml, mock_enable_cache, output_artifact, output_metrics, sample_input_file
+    ):
+        """Test that cache_dir is ignored when the optional diskcache package is not installed."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_flow.is_model_config_required.return_value = True
+        mock_from_yaml.return_value = mock_flow
+
+        _call_sdg(
+            output_artifact,
+            output_metrics,
+            input_pvc_path=sample_input_file,
+            flow_id="llm-flow",
+            model="openai/gpt-4o-mini",
+            temperature=0.0,
+            cache_dir="/mnt/cache/",
+        )
+
+        mock_enable_cache.assert_not_called()
+        mock_flow.generate.assert_called_once()
+
+    @pytest.mark.parametrize("temperature", [0.7, -1.0], ids=["stochastic", "flow_default"])
+    @mock.patch("litellm.enable_cache")
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_cache_dir_skipped_without_low_temperature(
+        self,
+        mock_get_path,
+        mock_from_yaml,
+        mock_enable_cache,
+        temperature,
+        output_artifact,
+        output_metrics,
+        sample_input_file,
+    ):
+        """Test that the response cache needs an explicit low temperature, not the flow's default."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_flow.is_model_config_required.return_value = True
+        mock_from_yaml.return_value = mock_flow
+
+        _call_sdg(
+            output_artifact,
+            output_metrics,
+            input_pvc_path=sample_input_file,
+            flow_id="llm-flow",
+            model="openai/gpt-4o-mini",
+            temperature=temperature,
+            cache_dir="/mnt/cache/",
+        )
+
+        mock_enable_cache.assert_not_called()
+
+
+class TestDatasetValidation:
+    """Tests for dataset validation."""
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_validates_sample_of_rows(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, sample_input_file
+    ):
+        """Test that only the first validate_sample_size rows are validated."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_from_yaml.return_value = mock_flow
+
+        _call_sdg(
+            output_artifact,
+            output_metrics,
+            input_pvc_path=sample_input_file,
+            flow_id="test-flow",
+            validate_sample_size=2,
+        )
+
+        mock_flow.validate_dataset.assert_called_once()
+        assert len(mock_flow.validate_dataset.call_args.args[0]) == 2
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_failed_sample_rechecked_on_full_dataset(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, sample_input_file
+    ):
+        """Test that a failing sample falls back to validating every row."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_flow.validate_dataset.side_effect = lambda df: ["Need at least 3 samples"] if len(df) < 3 else []
+        mock_from_yaml.return_value = mock_flow
+
+        _call_sdg(
+            output_artifact,
+            output_metrics,
+            input_pvc_path=sample_input_file,
+            flow_id="test-flow",
+            validate_sample_size=2,
+        )
+
+        assert mock_flow.validate_dataset.call_count == 2
+        assert len(mock_flow.validate_dataset.call_args.args[0]) == 3
 
 
 class TestFlowExecution:
@@ -388,6 +724,39 @@ class TestFlowExecution:
         call_kwargs = mock_flow.generate.call_args.kwargs
         assert call_kwargs["max_concurrency"] == 20
 
+    @pytest.mark.parametrize(
+        "env, model, expected",
+        [
+            ({}, "openai/gpt-4o-mini", 64),
+            ({"LLM_API_BASE": "http://localhost:8000/v1"}, "openai/granite", 128),
+            ({}, "hosted_vllm/granite", 128),
+            ({"SDG_MAX_CONCURRENCY": "32"}, "hosted_vllm/granite", 32),
+        ],
+    )
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_default_max_concurrency_sized_for_endpoint(
+        self, mock_get_path, mock_from_yaml, env, model, expected, output_artifact, output_metrics, sample_input_file
+    ):
+        """Test that the -1 sentinel resolves max_concurrency from env and endpoint."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_from_yaml.return_value = _make_mock_flow()
+
+        with mock.patch.dict(os.environ, env):
+            for key in {"LLM_API_BASE", "SDG_MAX_CONCURRENCY"} - env.keys():
+                os.environ.pop(key, None)
+            _call_sdg(
+                output_artifact,
+                output_metrics,
+                input_pvc_path=sample_input_file,
+                flow_id="test-flow",
+                model=model,
+                max_concurrency=-1,
+            )
+
+        call_kwargs = mock_from_yaml.return_value.generate.call_args.kwargs
+        assert call_kwargs["max_concurrency"] == expected
+
     @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
     @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
     def test_checkpointing_params_passed(
@@ -411,6 +780,96 @@ class TestFlowExecution:
         assert call_kwargs["checkpoint_dir"] == "/mnt/checkpoints/"
         assert call_kwargs["save_freq"] == 50
 
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_local_checkpoints_synced_to_pvc(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, sample_input_file, tmp_dir
+    ):
+        """Test that local checkpoints are seeded from and synced back to the PVC path."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        pvc_dir = os.path.join(tmp_dir, "checkpoints")
+        os.makedirs(pvc_dir)
+        with open(os.path.join(pvc_dir, "checkpoint_0001.jsonl"), "w") as f:
+            f.write("{}\n")
+
+        local_dirs = []
+
+        def generate(df, **kw):
+            local_dir = kw["checkpoint_dir"]
+            local_dirs.append(local_dir)
+            assert local_dir != pvc_dir
+            assert os.path.exists(os.path.join(local_dir, "checkpoint_0001.jsonl"))
+            with open(os.path.join(local_dir, "checkpoint_0002.jsonl"), "w") as f:
+                f.write("{}\n")
+            return df.copy()
+
+        mock_flow = _make_mock_flow()
+        mock_flow.generate.side_effect = generate
+        mock_from_yaml.return_value = mock_flow
+
+        _call_sdg(
+            output_artifact,
+            output_metrics,
+            input_pvc_path=sample_input_file,
+            flow_id="test-flow",
+            checkpoint_pvc_path=pvc_dir,
+            checkpoint_local_tmp=True,
+        )
+
+        assert sorted(os.listdir(pvc_dir)) == ["checkpoint_0001.jsonl", "checkpoint_0002.jsonl"]
+        assert not os.path.exists(local_dirs[0])
+
+    @mock.patch("litellm.disable_cache")
+    @mock.patch("litellm.enable_cache")
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_failed_checkpoint_sync_keeps_generation_error(
+        self,
+        mock_get_path,
+        mock_from_yaml,
+        mock_enable_cache,
+        mock_disable_cache,
+        output_artifact,
+        output_metrics,
+        sample_input_file,
+        tmp_dir,
+    ):
+        """Test that a failing final checkpoint sync neither masks the generation error nor skips cleanup."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        # A regular file where the PVC directory should be, so the final sync fails.
+        pvc_path = os.path.join(tmp_dir, "checkpoints")
+        with open(pvc_path, "w") as f:
+            f.write("")
+        local_dirs = []
+
+        def generate(df, **kw):
+            local_dirs.append(kw["checkpoint_dir"])
+            with open(os.path.join(kw["checkpoint_dir"], "checkpoint_0001.jsonl"), "w") as f:
+                f.write("{}\n")
+            raise RuntimeError("generation failed")
+
+        mock_flow = _make_mock_flow()
+        mock_flow.is_model_config_required.return_value = True
+        mock_flow.generate.side_effect = generate
+        mock_from_yaml.return_value = mock_flow
+
+        with pytest.raises(RuntimeError, match="generation failed"):
+            _call_sdg(
+                output_artifact,
+                output_metrics,
+                input_pvc_path=sample_input_file,
+                flow_id="llm-flow",
+                model="openai/gpt-4o-mini",
+                temperature=0.0,
+                cache_dir="/mnt/cache/",
+                checkpoint_pvc_path=pvc_path,
+                checkpoint_local_tmp=True,
+            )
+
+        mock_disable_cache.assert_called_once_with()
+        assert os.listdir(local_dirs[0]) == ["checkpoint_0001.jsonl"]
+        shutil.rmtree(local_dirs[0])
+
     @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
     @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
     def test_no_checkpoint_when_not_configured(
@@ -432,6 +891,49 @@ class TestFlowExecution:
         call_kwargs = mock_flow.generate.call_args.kwargs
         assert "checkpoint_dir" not in call_kwargs
 
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_dedup_inputs_generates_unique_rows_once(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, tmp_dir
+    ):
+        """Test that duplicate input rows are generated once and fanned back out."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_flow.generate.side_effect = lambda df, **kw: df.assign(answer=df["document"].str.upper())
+        mock_from_yaml.return_value = mock_flow
+        input_path = os.path.join(tmp_dir, "input.jsonl")
+        pd.DataFrame({"document": ["a", "b", "a"], "domain": ["x", "y", "x"]}).to_json(
+            input_path, orient="records", lines=True
+        )
+
+        _call_sdg(output_artifact, output_metrics, input_pvc_path=input_path, flow_id="test-flow", dedup_inputs=True)
+
+        assert len(mock_flow.generate.call_args.args[0]) == 2
+        result = pd.read_json(output_artifact.path, lines=True)
+        assert list(result.columns) == ["document", "domain", "answer"]
+        assert list(result["answer"]) == ["A", "B", "A"]
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_dedup_inputs_with_column_selecting_flow(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, tmp_dir
+    ):
+        """Test that dedup works for flows that drop input columns and never sees a helper column."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        mock_flow = _make_mock_flow()
+        mock_flow.generate.side_effect = lambda df, **kw: pd.DataFrame({"answer": df["document"].str.upper()})
+        mock_from_yaml.return_value = mock_flow
+        input_path = os.path.join(tmp_dir, "input.jsonl")
+        pd.DataFrame({"document": ["a", "b", "a"], "domain": ["x", "y", "x"]}).to_json(
+            input_path, orient="records", lines=True
+        )
+
+        _call_sdg(output_artifact, output_metrics, input_pvc_path=input_path, flow_id="test-flow", dedup_inputs=True)
+
+        assert list(mock_flow.generate.call_args.args[0].columns) == ["document", "domain"]
+        result = pd.read_json(output_artifact.path, lines=True)
+        assert list(result["answer"]) == ["A", "B", "A"]
+
     @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
     @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
     def test_output_reflects_flow_result(
@@ -488,6 +990,62 @@ class TestPVCExport:
         assert len(exported_df) == 3
         assert list(exported_df.columns) == ["document", "domain"]
 
+        with open(export_file, "rb") as exported, open(output_artifact.path, "rb") as artifact:
+            assert exported.read() == artifact.read()
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_export_serializes_nested_and_timestamp_values(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, sample_input_file, tmp_dir
+    ):
+        """Verify object arrays, numpy scalars and timestamps are written as JSON to the artifact and the export."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        result_df = pd.DataFrame(
+            {
+                "tags": [np.array(["a", "b"], dtype=object)],
+                "scores": [np.array([np.array([1, 2]), np.array([3])], dtype=object)],
+                "count": [np.int64(3)],
+                "created": [pd.Timestamp("2024-01-02T03:04:05")],
+                "missing": [pd.NaT],
+            }
+        )
+        mock_from_yaml.return_value = _make_mock_flow(return_df=result_df)
+        export_base = os.path.join(tmp_dir, "exports")
+
+        _call_sdg(
+            output_artifact,
+            output_metrics,
+            input_pvc_path=sample_input_file,
+            flow_id="test-flow",
+            export_to_pvc=True,
+            export_path=export_base,
+        )
+
+        with open(output_artifact.path) as f:
+            artifact = f.read()
+        assert artifact == (
+            '{"tags":["a","b"],"scores":[[1,2],[3]],"count":3,"created":"2024-01-02T03:04:05","missing":null}\n'
+        )
+        flow_dir = os.path.join(export_base, "test-flow")
+        (timestamp_dir,) = os.listdir(flow_dir)
+        with open(os.path.join(flow_dir, timestamp_dir, "generated.jsonl")) as f:
+            assert f.read() == artifact
+
+    @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
+    @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
+    def test_non_string_column_names_written_as_strings(
+        self, mock_get_path, mock_from_yaml, output_artifact, output_metrics, sample_input_file
+    ):
+        """Verify non-string column labels are written as string keys, as DataFrame.to_json did."""
+        mock_get_path.return_value = "/resolved/flow.yaml"
+        result_df = pd.DataFrame({0: ["a"], "document": ["Doc"], 1.5: [2]})
+        mock_from_yaml.return_value = _make_mock_flow(return_df=result_df)
+
+        _call_sdg(output_artifact, output_metrics, input_pvc_path=sample_input_file, flow_id="test-flow")
+
+        with open(output_artifact.path) as f:
+            assert f.read() == '{"0":"a","document":"Doc","1.5":2}\n'
+
     @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
     @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
     def test_export_disabled_no_write(
@@ -625,7 +1183,7 @@ class TestOutputHandling:
 
         _call_sdg(output_artifact, output_metrics, input_pvc_path=sample_input_file, flow_id="test-flow")
 
-        assert set(output_metrics.metadata.keys()) == {"input_rows", "output_rows", "execution_time_seconds"}
+        assert output_metrics.metadata.keys() == {"input_rows", "output_rows", "execution_time_seconds"}
 
     @mock.patch("sdg_hub.core.flow.base.Flow.from_yaml")
     @mock.patch("sdg_hub.core.flow.registry.FlowRegistry.get_flow_path_safe")
@@ -9,18 +9,19 @@ from kfp.kubernetes import use_config_map_as_volume, use_secret_as_env
 from kfp_components.components.data_processing.sdg.component import sdg
 
 
-@dsl.component(packages_to_install=["pandas"])
+@dsl.component
 def create_sample_data(output_data: dsl.Output[dsl.Dataset]) -> None:
     """Create sample input data with document and domain columns."""
-    import pandas as pd
+    import json
 
     data = [
         {"document": "Python is a programming language.", "domain": "technology"},
         {"document": "Machine learning is a subset of AI.", "domain": "technology"},
         {"document": "The Earth orbits the Sun.", "domain": "science"},
     ]
-    df = pd.DataFrame(data)
-    df.to_json(output_data.path, orient="records", lines=True)
+    with open(output_data.path, "w") as f:
+        for row in data:
+            f.write(json.dumps(row) + "\n")
 
 
 @dsl.pipeline(
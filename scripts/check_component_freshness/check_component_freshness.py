@@ -13,20 +13,35 @@ import yaml
 
 from ..lib.discovery import get_all_assets_with_metadata
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 # Thresholds in days
 FRESH_DAYS = 270  # 9 months
 STALE_DAYS = 360  # 12 months
 
 
-def parse_date(date_str: str) -> datetime:
+def parse_date(date_str: str | datetime) -> datetime:
     """Parse lastVerified timestamp from various formats.
 
     Args:
-        date_str: The date string to parse.
+        date_str: The date string to parse, or a datetime already resolved by the YAML loader.
 
     Returns:
         A datetime object representing the parsed date.
     """
+    if isinstance(date_str, datetime):
+        return date_str.replace(tzinfo=timezone.utc) if date_str.tzinfo is None else date_str
+    try:
+        # A single ISO 8601 parse covers every supported format; strptime is
+        # only tried, format by format, for strings it rejects.
+        dt = datetime.fromisoformat(str(date_str))
+    except ValueError:
+        pass
+    else:
+        return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
     for fmt in ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M:%S%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d"]:
         try:
             dt = datetime.strptime(str(date_str), fmt)
@@ -65,7 +80,7 @@ def scan_repo(repo_path: Path) -> dict:
     for asset in get_all_assets_with_metadata(repo_path):
         metadata_file = repo_path / asset / "metadata.yaml"
         try:
-            metadata = yaml.safe_load(metadata_file.read_text())
+            metadata = yaml.load(metadata_file.read_bytes(), Loader=_SafeLoader)
             if not metadata or "lastVerified" not in metadata:
                 print(f"Warning: Missing lastVerified in {metadata_file}, marking as stale", file=sys.stderr)
                 results["stale"].append(
@@ -28,6 +28,12 @@ class TestParsing:
         dt = parse_date("2025-11-15")
         assert dt.year == 2025 and dt.month == 11 and dt.day == 15
 
+    def test_parse_datetime_from_yaml(self):
+        """Test that timestamps already resolved by the YAML loader are used as-is."""
+        loaded = yaml.safe_load("lastVerified: 2025-11-13T00:00:00Z")["lastVerified"]
+        assert parse_date(loaded) == datetime(2025, 11, 13, tzinfo=timezone.utc)
+        assert parse_date(datetime(2025, 11, 13)) == datetime(2025, 11, 13, tzinfo=timezone.utc)
+
     def test_invalid_date(self):
         """Test invalid date."""
         with pytest.raises(ValueError):
@@ -69,7 +75,8 @@ class TestScanRepo:
         comp_dir = tmpdir / subdir / "test_category" / name
         comp_dir.mkdir(parents=True)
         date = (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
-        (comp_dir / "metadata.yaml").write_text(yaml.dump({"name": name, "lastVerified": date}))
+        # Quoted like yaml.dump would, so the loader sees a string rather than a timestamp.
+        (comp_dir / "metadata.yaml").write_text(f"name: {name}\nlastVerified: '{date}'\n")
 
     def test_categorizes_correctly(self):
         """Test categorizes correctly."""
@@ -94,7 +101,7 @@ class TestScanRepo:
             tmp = Path(tmpdir)
             comp_dir = tmp / "components" / "test_category" / "invalid"
             comp_dir.mkdir(parents=True)
-            (comp_dir / "metadata.yaml").write_text(yaml.dump({"name": "no-date"}))
+            (comp_dir / "metadata.yaml").write_text("name: no-date\n")
 
             results = scan_repo(tmp)
             assert len(results["fresh"]) == 0
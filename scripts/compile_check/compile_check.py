@@ -9,11 +9,13 @@ compiles successfully with the Kubeflow Pipelines SDK.
 from __future__ import annotations
 
 import argparse
+import importlib
 import logging
+import os
 import sys
 import tempfile
-import traceback
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -46,9 +48,18 @@ class ValidationResult:
     warnings: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
 
-    def add_error(self, message: str) -> None:
-        """Record a validation error and mark the result unsuccessful."""
+    def add_error(self, message: str, exc_info: bool = False) -> None:
+        """Record a validation error and mark the result unsuccessful.
+
+        Args:
+            message: Error message to record.
+            exc_info: Whether to log the traceback of the exception being handled
+                at debug level (shown with --verbose). The traceback is formatted
+                by the logging handler, not stored.
+        """
         logging.error(message)
+        if exc_info:
+            logging.debug("Traceback for the error above:", exc_info=True)
         self.errors.append(message)
         self.success = False
 
@@ -101,8 +112,13 @@ def _module_name_from_path(module_path: Path) -> str:
     return "compile_check_" + "_".join(sanitized_parts)
 
 
-def validate_target(target: MetadataTarget) -> ValidationResult:
-    """Validate a single metadata target by compiling exposed objects."""
+def validate_target(target: MetadataTarget, output_dir: Path) -> ValidationResult:
+    """Validate a single metadata target by compiling exposed objects.
+
+    Args:
+        target: The metadata target to validate.
+        output_dir: Scratch directory shared by all targets for compiled YAML.
+    """
     result = ValidationResult(target=target, success=True)
     dep_errors, dep_warnings = validate_dependencies(target.metadata)
     for warning in dep_warnings:
@@ -115,8 +131,8 @@ def validate_target(target: MetadataTarget) -> ValidationResult:
     try:
         module_name = _module_name_from_path(target.module_path)
         module = load_module_from_path(str(target.module_path), module_name)
-    except Exception:
-        result.add_error(f"Failed to load module defined in {target.module_path}.\n{traceback.format_exc()}")
+    except Exception as exc:
+        result.add_error(f"Failed to load module defined in {target.module_path}: {exc}", exc_info=True)
         return result
 
     objects = find_decorated_functions_runtime(module, target.target_kind)
@@ -129,33 +145,92 @@ def validate_target(target: MetadataTarget) -> ValidationResult:
         result.add_error(f"No @dsl.{target.target_kind} decorated functions discovered in module {target.module_path}.")
         return result
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        for attr_name, obj in objects:
-            try:
-                output_path = temp_path / f"{module_name}_{attr_name}.yaml"
-                compile_and_get_yaml(obj, str(output_path))
-                result.compiled_objects.append(f"{attr_name} -> {output_path.name}")
-                logging.debug(
-                    "Compiled %s from %s to %s",
-                    attr_name,
-                    target.module_path,
-                    output_path,
-                )
-            except Exception:
-                result.add_error(
-                    f"Failed to compile {target.target_kind} `{attr_name}` from {target.module_path}.\n"
-                    f"{traceback.format_exc()}"
-                )
-                if result.errors:
-                    # stop compiling additional objects from this module to avoid noise
-                    break
+    for attr_name, obj in objects:
+        try:
+            output_path = output_dir / f"{module_name}_{attr_name}.yaml"
+            compile_and_get_yaml(obj, str(output_path))
+            result.compiled_objects.append(f"{attr_name} -> {output_path.name}")
+            logging.debug(
+                "Compiled %s from %s to %s",
+                attr_name,
+                target.module_path,
+                output_path,
+            )
+        except Exception as exc:
+            result.add_error(
+                f"Failed to compile {target.target_kind} `{attr_name}` from {target.module_path}: {exc}",
+                exc_info=True,
+            )
+            if result.errors:
+                # stop compiling additional objects from this module to avoid noise
+                break
 
     return result
 
 
+def _init_worker(repo_root: str, verbose: bool) -> None:
+    """Prepare a worker process to validate targets.
+
+    Args:
+        repo_root: Repository root used to resolve module names and imports.
+        verbose: Whether to enable verbose logging in the worker.
+    """
+    global REPO_ROOT
+    REPO_ROOT = Path(repo_root)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+    # Refresh finder caches once per worker; modules imported afterwards stay in
+    # sys.modules and are shared by every target the worker validates.
+    importlib.invalidate_caches()
+    # Import the KFP compiler up front so its import cost is paid once per
+    # worker rather than by whichever target the worker compiles first.
+    importlib.import_module("kfp.compiler")
+    configure_logging(verbose)
+
+
+def _display_name(target: MetadataTarget) -> str:
+    """Return a human-readable name for a target."""
+    display_name = target.metadata.get("name")
+    if display_name:
+        return display_name
+    try:
+        return str(target.metadata_path.parent.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(target.metadata_path.parent)
+
+
+def _iter_results(targets: list[MetadataTarget], output_dir: Path, verbose: bool) -> Iterator[ValidationResult]:
+    """Yield validation results as targets finish.
+
+    A single target (or a single CPU) is validated in-process, skipping the
+    cost of starting a worker pool. Otherwise targets are spread across a
+    process pool, one worker per CPU. Closing the iterator early cancels any
+    targets that have not started yet.
+    """
+    max_workers = min(len(targets), os.cpu_count() or 1)
+    if max_workers == 1:
+        for target in targets:
+            yield validate_target(target, output_dir)
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(str(REPO_ROOT), verbose),
+    )
+    try:
+        futures = [executor.submit(validate_target, target, output_dir) for target in targets]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def run_validation(args: argparse.Namespace) -> int:
-    """Validate all discovered metadata targets."""
+    """Validate all discovered metadata targets.
+
+    Targets are validated concurrently in a process pool, one worker per CPU.
+    """
     configure_logging(args.verbose)
 
     discovered = discover_metadata_files(repo_root=REPO_ROOT)
@@ -172,36 +247,31 @@ def run_validation(args: argparse.Namespace) -> int:
         return 0
 
     results: list[ValidationResult] = []
-    for target in targets:
-        display_name = target.metadata.get("name")
-        if not display_name:
-            try:
-                display_name = str(target.metadata_path.parent.relative_to(REPO_ROOT))
-            except ValueError:
-                display_name = str(target.metadata_path.parent)
-        logging.info(
-            "Validating %s (%s) from %s",
-            display_name,
-            target.target_kind,
-            target.metadata_path,
-        )
-        result = validate_target(target)
-        results.append(result)
-
-        if result.success:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for result in _iter_results(targets, Path(temp_dir), args.verbose):
+            results.append(result)
+            display_name = _display_name(result.target)
             logging.info(
-                "✓ %s compiled successfully (%s)",
-                display_name,
-                ", ".join(result.compiled_objects) if result.compiled_objects else "no output",
-            )
-        else:
-            logging.error(
-                "✗ %s failed validation (%d error(s))",
+                "Validating %s (%s) from %s",
                 display_name,
-                len(result.errors),
+                result.target.target_kind,
+                result.target.metadata_path,
             )
-            if args.fail_fast:
-                break
+
+            if result.success:
+                logging.info(
+                    "✓ %s compiled successfully (%s)",
+                    display_name,
+                    ", ".join(result.compiled_objects) if result.compiled_objects else "no output",
+                )
+            else:
+                logging.error(
+                    "✗ %s failed validation (%d error(s))",
+                    display_name,
+                    len(result.errors),
+                )
+                if args.fail_fast:
+                    break
 
     failed = [res for res in results if not res.success]
     logging.info(
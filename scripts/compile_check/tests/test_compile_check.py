@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import logging
 import tempfile
 import textwrap
 import unittest
@@ -192,6 +193,47 @@ helper(x=1)
         exit_code = self._run_check()
         self.assertEqual(exit_code, 1)
 
+    def test_multiple_targets_with_one_failure(self) -> None:
+        """A failing target among several valid ones fails the overall check."""
+        for index in range(3):
+            self._create_component(
+                f"valid_component_{index}",
+                metadata={"dependencies": {}},
+                body="return a + 1",
+            )
+        self._create_component(
+            "bad_dependency_component",
+            metadata={"dependencies": {"kubeflow": [{"name": "Pipelines", "version": ">>=bad"}]}},
+            body="return a + 1",
+        )
+        self.assertEqual(self._run_check(), 1)
+        self.assertEqual(self._run_check(fail_fast=True), 1)
+
+    def test_module_import_failure_records_exception(self) -> None:
+        """An import failure records the exception message and logs the traceback at debug level."""
+        component_dir = self._create_component(
+            "broken_component",
+            metadata={"dependencies": {}},
+            body="return a + 1",
+        )
+        _write_file(component_dir / "component.py", "raise RuntimeError('boom')\n")
+        target = compile_check.MetadataTarget(
+            metadata_path=component_dir / "metadata.yaml",
+            module_path=component_dir / "component.py",
+            target_kind="component",
+            metadata={"name": "broken_component"},
+        )
+
+        with self.assertLogs(level="DEBUG") as logs:
+            result = compile_check.validate_target(target, self.repo_root)
+
+        self.assertFalse(result.success)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0].endswith(": boom"))
+        self.assertNotIn("Traceback", result.errors[0])
+        traceback_levels = [record.levelno for record, line in zip(logs.records, logs.output) if "Traceback" in line]
+        self.assertEqual(traceback_levels, [logging.DEBUG])
+
     def test_pipeline_missing_decorator_fails(self) -> None:
         """A pipeline module without @dsl.pipeline decorator fails validation."""
         self._create_pipeline(
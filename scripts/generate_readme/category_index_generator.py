@@ -1,11 +1,11 @@
 """Category and subcategory index generators for KFP components and pipelines."""
 
+import functools
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import yaml
-from jinja2 import Environment, FileSystemLoader
 
 from scripts.generate_readme.constants import (
     CATEGORY_README_TEMPLATE,
@@ -13,11 +13,26 @@ from scripts.generate_readme.constants import (
     SUBCATEGORY_README_TEMPLATE,
 )
 from scripts.generate_readme.metadata_parser import MetadataParser
-from scripts.generate_readme.utils import format_title
+from scripts.generate_readme.utils import format_title, get_template_env
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _load_metadata_name(metadata_file: str, mtime_ns: int) -> Optional[str]:
+    """Return the `name` field of a metadata.yaml file, or None if it is missing.
+
+    Results are cached per file and modification time, so the category and
+    subcategory indexes rebuilt for every README in a run parse each sibling's
+    metadata only once.
+    """
+    with open(metadata_file, "r", encoding="utf-8") as f:
+        yaml_data = yaml.safe_load(f)
+    if yaml_data and "name" in yaml_data:
+        return yaml_data["name"]
+    return None
+
+
 class _BaseIndexGenerator:
     """Base class for index generators with shared Jinja2 setup and item extraction."""
 
@@ -37,13 +52,7 @@ class _BaseIndexGenerator:
         self.type_name = "Components" if is_component else "Pipelines"
         self._target_file = "component.py" if is_component else "pipeline.py"
 
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.env = get_template_env()
         self.template = self.env.get_template(template_name)
 
     def _get_display_name(self, item_dir: Path) -> str:
@@ -60,14 +69,13 @@ class _BaseIndexGenerator:
         """
         metadata_file = item_dir / "metadata.yaml"
         try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                yaml_data = yaml.safe_load(f)
-                if yaml_data and "name" in yaml_data:
-                    return yaml_data["name"]
+            name = _load_metadata_name(str(metadata_file), metadata_file.stat().st_mtime_ns)
         except Exception as e:
             logger.debug(f"Could not load name from {metadata_file.name}: {e}")
             raise
-        raise ValueError(f"Required `name` field not found in {metadata_file.name}")
+        if name is None:
+            raise ValueError(f"Required `name` field not found in {metadata_file.name}")
+        return name
 
     def _extract_item_info(self, item_dir: Path) -> Optional[Dict[str, str]]:
         """Extract name and overview from a component/pipeline.
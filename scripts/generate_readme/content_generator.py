@@ -1,19 +1,34 @@
 """README content generator for KFP components and pipelines."""
 
+import functools
 import logging
 import textwrap
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
-from jinja2 import Environment, FileSystemLoader
 
 from scripts.generate_readme.constants import MAX_LINE_LENGTH, README_TEMPLATE
-from scripts.generate_readme.utils import format_title
+from scripts.generate_readme.utils import format_title, get_template_env
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _read_owners(owners_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse an OWNERS file, caching the result per file and modification time.
+
+    Callers must copy the returned mapping before mutating it.
+    """
+    with open(owners_file, "rb") as f:
+        return yaml.load(f.read(), Loader=_SafeLoader) or {}
+
+
 def wrap_text(text: str, width: int = MAX_LINE_LENGTH) -> str:
     """Wrap text to specified width while preserving paragraph breaks.
 
@@ -58,13 +73,7 @@ class ReadmeContentGenerator:
         self.owners_file = source_dir / "OWNERS"
         self.feature_metadata = self._load_feature_metadata()
 
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.env = get_template_env()
         self.template = self.env.get_template(README_TEMPLATE)
 
     def _load_feature_metadata(self) -> Dict[str, Any]:
@@ -111,9 +120,8 @@ class ReadmeContentGenerator:
         """
         if self.owners_file.exists():
             try:
-                with open(self.owners_file, "r", encoding="utf-8") as f:
-                    owners_data = yaml.safe_load(f)
-                return owners_data or {}
+                mtime_ns = self.owners_file.stat().st_mtime_ns
+                return dict(_read_owners(str(self.owners_file), mtime_ns))
             except Exception as e:
                 logger.warning(f"Error reading OWNERS file ({self.owners_file}): {e}")
                 return {}
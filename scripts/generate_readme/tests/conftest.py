@@ -13,10 +13,13 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def component_dir(temp_dir):
-    """Create a minimal valid component directory for testing."""
-    comp_dir = temp_dir / "test_component"
+@pytest.fixture(scope="module")
+def component_dir(tmp_path_factory):
+    """Create a minimal valid component directory for testing.
+
+    Tests only read from this directory, so it is built once per module.
+    """
+    comp_dir = tmp_path_factory.mktemp("component") / "test_component"
     comp_dir.mkdir()
 
     # Create minimal component.py
@@ -45,10 +48,13 @@ description: Test component for CLI tests
     return comp_dir
 
 
-@pytest.fixture
-def pipeline_dir(temp_dir):
-    """Create a minimal valid pipeline directory for testing."""
-    pipe_dir = temp_dir / "test_pipeline"
+@pytest.fixture(scope="module")
+def pipeline_dir(tmp_path_factory):
+    """Create a minimal valid pipeline directory for testing.
+
+    Tests only read from this directory, so it is built once per module.
+    """
+    pipe_dir = tmp_path_factory.mktemp("pipeline") / "test_pipeline"
     pipe_dir.mkdir()
 
     # Create minimal pipeline.py
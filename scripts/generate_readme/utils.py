@@ -1,11 +1,44 @@
 """Utility functions for README generation."""
 
+import functools
 import re
+from pathlib import Path
 
+from jinja2 import Environment, FileSystemLoader
 
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+_CAMEL_CASE_BOUNDARY = re.compile(r"([a-z])([A-Z])")
+# Known acronyms kept in uppercase
+_ACRONYMS = frozenset({"KFP", "API", "URL", "ID", "UI", "CI", "CD"})
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_env() -> Environment:
+    """Return the shared Jinja2 environment for README templates.
+
+    The environment is created once per process so compiled templates are
+    reused across every component, pipeline, and category README rendered.
+    `auto_reload` is disabled to avoid re-checking template files on each lookup.
+
+    Returns:
+        Jinja2 environment loading templates from the package templates directory.
+    """
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
 def format_title(title: str) -> str:
     """Format a title from snake_case, kebab-case, or camelCase to Title Case.
 
+    Results are cached because the same metadata keys (e.g. name, version,
+    approvers) are formatted repeatedly while rendering a README.
+
     Args:
         title: The title to format.
 
@@ -13,7 +46,7 @@ def format_title(title: str) -> str:
         Formatted title in Title Case with spaces.
     """
     # First, handle camelCase by inserting spaces before capitals
-    title = re.sub(r"([a-z])([A-Z])", r"\1 \2", title)
+    title = _CAMEL_CASE_BOUNDARY.sub(r"\1 \2", title)
 
     # Replace underscores and hyphens with spaces
     title = title.replace("_", " ").replace("-", " ")
@@ -24,7 +57,7 @@ def format_title(title: str) -> str:
 
     for word in words:
         # Keep known acronyms in uppercase
-        if word.upper() in ["KFP", "API", "URL", "ID", "UI", "CI", "CD"]:
+        if word.upper() in _ACRONYMS:
             formatted_words.append(word.upper())
         else:
             formatted_words.append(word.capitalize())
@@ -16,6 +16,7 @@ Usage:
 """
 
 import argparse
+import functools
 import keyword
 import os
 import sys
@@ -25,17 +26,35 @@ from pathlib import Path
 import jinja2
 
 
+@functools.lru_cache(maxsize=None)
 def _get_template_env() -> jinja2.Environment:
-    """Get Jinja2 environment with template loader."""
+    """Get the shared Jinja2 environment with template loader.
+
+    The environment is built once per process so compiled templates are reused
+    across the component, test, and subcategory generators. Templates do not
+    change during a run, so `auto_reload` is disabled to skip the up-to-date
+    check on every lookup.
+    """
     template_dir = Path(__file__).parent / "templates"
     return jinja2.Environment(
         loader=jinja2.FileSystemLoader(template_dir),
         trim_blocks=True,
         lstrip_blocks=True,
         keep_trailing_newline=True,
+        auto_reload=False,
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_owners_content() -> str:
+    """Render the placeholder OWNERS file.
+
+    The template takes no variables, so it is rendered once and reused for
+    every asset and subcategory.
+    """
+    return _get_template_env().get_template("OWNERS.j2").render()
+
+
 def validate_name(name: str) -> None:
     """Validate component/pipeline name for security and Python compatibility.
 
@@ -180,13 +199,10 @@ def generate_subcategory_files(subcategory: str) -> dict[str, str]:
     Returns:
         Dict of filename to content mappings
     """
-    env = _get_template_env()
-
     files = {}
 
     # Generate OWNERS for subcategory
-    template = env.get_template("OWNERS.j2")
-    files["OWNERS"] = template.render()
+    files["OWNERS"] = _get_owners_content()
 
     # Generate a simple README for subcategory
     readme_content = f"""# {subcategory.replace("_", " ").title()}
@@ -299,8 +315,7 @@ def generate_core_files(skeleton_type: str, category: str, name: str) -> dict[st
     files["metadata.yaml"] = template.render(context)
 
     # Generate OWNERS
-    template = env.get_template("OWNERS.j2")
-    files["OWNERS"] = template.render(context)
+    files["OWNERS"] = _get_owners_content()
 
     # Generate placeholder README.md
     title = name.replace("_", " ").title()
@@ -1,5 +1,6 @@
 """Base image extraction and validation utilities."""
 
+import functools
 import os
 import re
 import tempfile
@@ -14,6 +15,9 @@ from .kfp_compilation import compile_and_get_yaml, find_decorated_functions_runt
 from .oci import validate_tag
 from .parsing import get_base_image_locations
 
+_NON_IDENTIFIER_CHARS = re.compile(r"\W+")
+_ASSET_FILENAMES = {"component.py": "component", "pipeline.py": "pipeline"}
+
 
 class BaseImageTagCheckError(RuntimeError):
     """Raised when base_image tag checking fails due to load/compile errors."""
@@ -69,9 +73,13 @@ def load_base_image_allowlist(path: Path) -> BaseImageAllowlist:
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def _is_allowlisted_image(image: str, allowlist: BaseImageAllowlist) -> bool:
     """Check if an image matches the allowlist.
 
+    Results are memoized per (image, allowlist) pair, so an image shared by many
+    assets is matched against the allowlist patterns only once per run.
+
     Args:
         image: Image name to check.
         allowlist: Allowlist configuration.
@@ -223,20 +231,28 @@ def validate_base_images(
 
 
 def _sanitize_module_name(asset_file: Path, asset_type: str) -> str:
-    name = re.sub(r"\W+", "_", f"check_base_image_tags_{asset_type}_{asset_file}")
+    name = _NON_IDENTIFIER_CHARS.sub("_", f"check_base_image_tags_{asset_type}_{asset_file}")
     if not name.isidentifier():
         name = f"m_{name}"
     return name
 
 
 def _discover_candidate_asset_files(directories: list[str]) -> list[tuple[str, Path]]:
+    # One scandir walk per directory finds both asset kinds, instead of a
+    # separate rglob pass for component.py and for pipeline.py.
     candidate_files: list[tuple[str, Path]] = []
     for directory in directories:
-        dir_path = Path(directory)
-        if not dir_path.exists():
-            continue
-        candidate_files.extend(("component", p) for p in dir_path.rglob("component.py"))
-        candidate_files.extend(("pipeline", p) for p in dir_path.rglob("pipeline.py"))
+        stack = [directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name in _ASSET_FILENAMES:
+                            candidate_files.append((_ASSET_FILENAMES[entry.name], Path(entry.path)))
+            except OSError:
+                continue
     candidate_files.sort(key=lambda x: str(x[1]))
     return candidate_files
 
@@ -1,5 +1,6 @@
 """Asset discovery utilities for KFP components and pipelines."""
 
+import os
 from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
@@ -7,11 +8,13 @@ from typing import Any
 _COMPONENT_FILENAME = "component.py"
 _PIPELINE_FILENAME = "pipeline.py"
 _RESERVED_SUBDIRS = {"tests", "shared"}
+# Resolved once at import; the repository root cannot move during a run.
+_REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 def get_repo_root() -> Path:
     """Get the repository root directory."""
-    return Path(__file__).resolve().parents[2]
+    return _REPO_ROOT
 
 
 def _get_default_targets() -> tuple[Path, Path]:
@@ -129,32 +132,39 @@ def find_assets_with_metadata(asset_type: str, base_path: Path | None = None) ->
         base_path = Path(".")
     root = base_path / asset_type
 
-    if not root.exists():
+    try:
+        categories = _visible_subdirs(root)
+    except FileNotFoundError:
         return assets
 
-    for category in root.iterdir():
-        if not category.is_dir() or category.name.startswith((".", "_")):
-            continue
-
-        for item in category.iterdir():
-            if not item.is_dir() or item.name.startswith((".", "_")):
-                continue
-
+    for category in categories:
+        for item in _visible_subdirs(category.path):
             # Check if this is a direct asset
-            if (item / "metadata.yaml").exists():
+            if os.path.exists(os.path.join(item.path, "metadata.yaml")):
                 assets.append(f"{asset_type}/{category.name}/{item.name}")
             else:
                 # This might be a subcategory
-                for subitem in item.iterdir():
-                    if not subitem.is_dir() or subitem.name.startswith((".", "_")) or subitem.name in _RESERVED_SUBDIRS:
+                for subitem in _visible_subdirs(item.path):
+                    if subitem.name in _RESERVED_SUBDIRS:
                         continue
 
-                    if (subitem / "metadata.yaml").exists():
+                    if os.path.exists(os.path.join(subitem.path, "metadata.yaml")):
                         assets.append(f"{asset_type}/{category.name}/{item.name}/{subitem.name}")
 
     return assets
 
 
+def _visible_subdirs(directory: str | Path) -> list[os.DirEntry]:
+    """List subdirectories of a directory, skipping hidden and private ones.
+
+    A single scandir pass answers both "does it exist" (FileNotFoundError
+    propagates to the caller) and "is it a directory" (from the cached entry
+    type) without extra stat calls.
+    """
+    with os.scandir(directory) as entries:
+        return [entry for entry in entries if entry.is_dir() and not entry.name.startswith((".", "_"))]
+
+
 def get_all_assets_with_metadata(base_path: Path | None = None) -> list[str]:
     """Get all assets with metadata from the repository."""
     return find_assets_with_metadata("components", base_path) + find_assets_with_metadata("pipelines", base_path)
@@ -169,30 +179,36 @@ def get_submodules(package_name: str) -> list[str]:
     Returns:
         Sorted list of submodule names
     """
-    package_path = Path(package_name)
-    if not package_path.exists():
+    try:
+        with os.scandir(package_name) as entries:
+            # Filter on the name and the directory-entry type first, so only
+            # real subdirectories cost a stat for their __init__.py.
+            return sorted(
+                entry.name
+                for entry in entries
+                if not entry.name.startswith("_")
+                and entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, "__init__.py"))
+            )
+    except FileNotFoundError:
         return []
 
-    submodules = []
-    for item in package_path.iterdir():
-        if item.is_dir() and (item / "__init__.py").exists() and not item.name.startswith("_"):
-            submodules.append(item.name)
-
-    return sorted(submodules)
 
-
-def resolve_component_path(repo_root: Path, raw: str) -> Path:
-    """Resolve and validate a component file path.
+def _resolve_asset_path(repo_root: Path, raw: str, asset_root: str, filename: str, label: str) -> Path:
+    """Resolve and validate an asset file path under an asset root.
 
     Args:
         repo_root: Repository root directory.
-        raw: Component path (directory or file path, relative or absolute).
+        raw: Asset path (directory or file path, relative or absolute).
+        asset_root: Either 'components' or 'pipelines'.
+        filename: Expected asset filename (component.py or pipeline.py).
+        label: Capitalized asset kind used in error messages.
 
     Returns:
-        Resolved path to the component.py file.
+        Resolved path to the asset file.
 
     Raises:
-        ValueError: If the path is invalid or outside the components directory.
+        ValueError: If the path is invalid or outside the asset root.
     """
     path = Path(raw)
     if not path.is_absolute():
@@ -200,53 +216,51 @@ def resolve_component_path(repo_root: Path, raw: str) -> Path:
     path = path.resolve()
 
     if path.is_dir():
-        path = (path / _COMPONENT_FILENAME).resolve()
+        path = (path / filename).resolve()
 
-    components_root = (repo_root / "components").resolve()
-    if not path.is_relative_to(components_root):
-        raise ValueError(f"Component path must be under {components_root}: {path}")
+    root = (repo_root / asset_root).resolve()
+    if not path.is_relative_to(root):
+        raise ValueError(f"{label} path must be under {root}: {path}")
 
-    if path.name != _COMPONENT_FILENAME:
-        raise ValueError(f"Component path must point to {_COMPONENT_FILENAME}: {path}")
+    if path.name != filename:
+        raise ValueError(f"{label} path must point to {filename}: {path}")
 
     if not path.exists():
-        raise ValueError(f"Component file not found: {path}")
+        raise ValueError(f"{label} file not found: {path}")
 
     return path
 
 
-def resolve_pipeline_path(repo_root: Path, raw: str) -> Path:
-    """Resolve and validate a pipeline file path.
+def resolve_component_path(repo_root: Path, raw: str) -> Path:
+    """Resolve and validate a component file path.
 
     Args:
         repo_root: Repository root directory.
-        raw: Pipeline path (directory or file path, relative or absolute).
+        raw: Component path (directory or file path, relative or absolute).
 
     Returns:
-        Resolved path to the pipeline.py file.
+        Resolved path to the component.py file.
 
     Raises:
-        ValueError: If the path is invalid or outside the pipelines directory.
+        ValueError: If the path is invalid or outside the components directory.
     """
-    path = Path(raw)
-    if not path.is_absolute():
-        path = repo_root / path
-    path = path.resolve()
+    return _resolve_asset_path(repo_root, raw, "components", _COMPONENT_FILENAME, "Component")
 
-    if path.is_dir():
-        path = (path / _PIPELINE_FILENAME).resolve()
 
-    pipelines_root = (repo_root / "pipelines").resolve()
-    if not path.is_relative_to(pipelines_root):
-        raise ValueError(f"Pipeline path must be under {pipelines_root}: {path}")
+def resolve_pipeline_path(repo_root: Path, raw: str) -> Path:
+    """Resolve and validate a pipeline file path.
 
-    if path.name != _PIPELINE_FILENAME:
-        raise ValueError(f"Pipeline path must point to {_PIPELINE_FILENAME}: {path}")
+    Args:
+        repo_root: Repository root directory.
+        raw: Pipeline path (directory or file path, relative or absolute).
 
-    if not path.exists():
-        raise ValueError(f"Pipeline file not found: {path}")
+    Returns:
+        Resolved path to the pipeline.py file.
 
-    return path
+    Raises:
+        ValueError: If the path is invalid or outside the pipelines directory.
+    """
+    return _resolve_asset_path(repo_root, raw, "pipelines", _PIPELINE_FILENAME, "Pipeline")
 
 
 def _build_asset_dict_from_repo_path(
@@ -109,10 +109,11 @@ def find_decorated_functions_runtime(module: Any, decorator_type: str) -> list[t
         List of tuples (function_name, function_object).
     """
     functions = []
-    for attr_name in dir(module):
+    # Scan the module namespace directly; dir() would sort every name and getattr
+    # would go through attribute lookup for each one.
+    for attr_name, attr in vars(module).items():
         if attr_name.startswith("_"):
             continue
-        attr = getattr(module, attr_name, None)
         if attr is None or not callable(attr):
             continue
         is_component = hasattr(attr, "component_spec") or (
@@ -122,6 +123,7 @@ def find_decorated_functions_runtime(module: Any, decorator_type: str) -> list[t
         is_match = (decorator_type == "component" and is_component) or (decorator_type == "pipeline" and is_pipeline)
         if is_match:
             functions.append((attr_name, attr))
+    functions.sort(key=lambda item: item[0])
     return functions
 
 
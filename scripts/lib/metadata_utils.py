@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from collections.abc import Iterable, Sequence
+import os
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
@@ -13,8 +17,18 @@ from packaging.specifiers import SpecifierSet
 
 from .discovery import get_repo_root
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 LOGGER = logging.getLogger(__name__)
 
+_METADATA_FILENAME = "metadata.yaml"
+_MAX_LOAD_WORKERS = 32
+_MODULE_FILENAMES = {"component": "component.py", "pipeline": "pipeline.py"}
+_SKIP_DIRS = frozenset({"__pycache__", ".git", ".venv", "node_modules", "build", "dist", ".tox", ".mypy_cache"})
+
 
 @dataclass
 class MetadataTarget:
@@ -27,8 +41,11 @@ class MetadataTarget:
     metadata: dict[str, Any]
 
 
-def discover_metadata_files(repo_root: Optional[Path] = None) -> list[tuple[Path, str]]:
-    """Return a list of (metadata_path, target_kind) for the repository.
+def discover_metadata_files(repo_root: Optional[Path] = None) -> list[tuple[Path, str, Optional[Path]]]:
+    """Return a list of (metadata_path, target_kind, module_path) for the repository.
+
+    The module path is resolved from the same directory listing that located
+    `metadata.yaml`, and is None when the expected module file is absent.
 
     Args:
         repo_root: Optional repository root. Defaults to the project root.
@@ -41,22 +58,50 @@ def discover_metadata_files(repo_root: Optional[Path] = None) -> list[tuple[Path
         (repo_root / "pipelines", "pipeline"),
     ]
 
-    discovered: list[tuple[Path, str]] = []
+    discovered: list[tuple[Path, str, Optional[Path]]] = []
     for root, target_kind in search_roots:
-        if not root.exists():
-            continue
-        for metadata_path in root.glob("**/metadata.yaml"):
-            discovered.append((metadata_path, target_kind))
+        for metadata_path, module_path in _walk_metadata_files(root, _MODULE_FILENAMES[target_kind]):
+            discovered.append((metadata_path, target_kind, module_path))
     return discovered
 
 
+def _walk_metadata_files(root: Path, module_filename: str) -> Iterator[tuple[Path, Optional[Path]]]:
+    """Yield (metadata_path, module_path) pairs under root, pruning at each asset directory.
+
+    Components and pipelines are leaves, so once a directory contains
+    `metadata.yaml` its subdirectories (tests, shared, test data) are not
+    scanned. Hidden and build/cache directories are skipped entirely.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = {entry.name: entry for entry in iterator}
+        except OSError:
+            continue
+
+        metadata_entry = entries.get(_METADATA_FILENAME)
+        if metadata_entry is not None and metadata_entry.is_file(follow_symlinks=False):
+            module_entry = entries.get(module_filename)
+            module_path = Path(module_entry.path) if module_entry is not None and module_entry.is_file() else None
+            yield Path(metadata_entry.path), module_path
+            continue
+
+        subdirs = [
+            entry.path
+            for name, entry in entries.items()
+            if name not in _SKIP_DIRS and not name.startswith(".") and entry.is_dir(follow_symlinks=False)
+        ]
+        stack.extend(Path(subdir) for subdir in sorted(subdirs, reverse=True))
+
+
 def load_metadata(metadata_path: Path) -> dict[str, Any]:
     """Load and validate a metadata YAML file."""
-    with metadata_path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
-        if not isinstance(data, dict):
-            raise ValueError(f"Metadata at {metadata_path} must be a mapping.")
-        return data
+    data = yaml.load(metadata_path.read_bytes(), Loader=_SafeLoader) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Metadata at {metadata_path} must be a mapping.")
+    return data
 
 
 def metadata_should_run(metadata: dict[str, Any], include_flagless: bool) -> bool:
@@ -79,8 +124,44 @@ def _normalize_path_filters(path_filters: Sequence[str], repo_root: Path) -> lis
     return normalized
 
 
+def _compile_path_filters(normalized_filters: Sequence[Path]) -> tuple[Optional[re.Pattern[str]], frozenset[str]]:
+    """Compile resolved filters into a directory-prefix regex and a set of file paths.
+
+    Directory filters are joined into one anchored alternation, each ending with
+    a path separator, so a single match call tests a directory against every
+    filter and matches the directory itself and everything beneath it.
+    """
+    dir_prefixes: list[str] = []
+    file_filters: set[str] = set()
+    for filter_path in normalized_filters:
+        if filter_path.is_dir():
+            dir_prefixes.append(os.path.join(str(filter_path), ""))
+        else:
+            file_filters.add(str(filter_path))
+    dir_pattern = re.compile("|".join(map(re.escape, dir_prefixes))) if dir_prefixes else None
+    return dir_pattern, frozenset(file_filters)
+
+
+def _matches_path_filters(
+    metadata_path: Path,
+    module_path: Optional[Path],
+    dir_pattern: Optional[re.Pattern[str]],
+    file_filters: frozenset[str],
+) -> bool:
+    """Return whether a metadata target falls under any of the path filters."""
+    metadata_dir = os.path.join(str(metadata_path.parent.resolve()), "")
+    if dir_pattern is not None and dir_pattern.match(metadata_dir):
+        return True
+    if file_filters:
+        if metadata_dir + metadata_path.name in file_filters:
+            return True
+        if module_path is not None and metadata_dir + module_path.name in file_filters:
+            return True
+    return False
+
+
 def create_metadata_targets(
-    discovered: Iterable[tuple[Path, str]],
+    discovered: Iterable[tuple[Path, str, Optional[Path]]],
     include_flagless: bool,
     path_filters: Sequence[str],
     *,
@@ -90,7 +171,9 @@ def create_metadata_targets(
     """Build MetadataTarget objects from discovered metadata files.
 
     Args:
-        discovered: Iterable of (metadata_path, target_kind) tuples.
+        discovered: Iterable of (metadata_path, target_kind, module_path) tuples as
+            returned by discover_metadata_files. A module_path of None marks a
+            metadata file without its expected module.
         include_flagless: Whether to include metadata without explicit flags.
         path_filters: Optional path filters to limit processed metadata.
         repo_root: Optional repository root override.
@@ -100,40 +183,31 @@ def create_metadata_targets(
         repo_root = get_repo_root()
     log = logger or LOGGER
     normalized_filters = _normalize_path_filters(path_filters, repo_root)
+    dir_pattern, file_filters = _compile_path_filters(normalized_filters)
 
-    targets: list[MetadataTarget] = []
+    candidates = [
+        (metadata_path, target_kind, module_path)
+        for metadata_path, target_kind, module_path in discovered
+        if not normalized_filters or _matches_path_filters(metadata_path, module_path, dir_pattern, file_filters)
+    ]
+    if not candidates:
+        return []
 
-    for metadata_path, target_kind in discovered:
-        metadata = load_metadata(metadata_path)
+    # Metadata files are independent, so read and parse them concurrently.
+    with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(candidates))) as executor:
+        loaded = list(executor.map(load_metadata, [metadata_path for metadata_path, _, _ in candidates]))
 
+    targets: list[MetadataTarget] = []
+
+    for (metadata_path, target_kind, module_path), metadata in zip(candidates, loaded):
         if not metadata_should_run(metadata, include_flagless):
             log.debug("Skipping %s (compile_check disabled).", metadata_path)
             continue
 
-        module_filename = "component.py" if target_kind == "component" else "pipeline.py"
-        module_path = metadata_path.with_name(module_filename)
-        metadata_dir = metadata_path.parent.resolve()
-        metadata_file = metadata_path.resolve()
-        module_file = module_path.resolve()
-
-        if normalized_filters:
-            matched = False
-            for filter_path in normalized_filters:
-                if filter_path.is_dir():
-                    if metadata_dir.is_relative_to(filter_path):
-                        matched = True
-                        break
-                else:
-                    if metadata_file == filter_path or module_file == filter_path:
-                        matched = True
-                        break
-            if not matched:
-                continue
-
-        if not module_path.exists():
+        if module_path is None:
             log.error(
                 "Expected module %s not found for metadata %s",
-                module_path,
+                metadata_path.with_name(_MODULE_FILENAMES[target_kind]),
                 metadata_path,
             )
             continue
@@ -149,6 +223,12 @@ def create_metadata_targets(
     return targets
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_specifier(spec: str) -> SpecifierSet:
+    """Parse a version specifier, reusing results for repeated pins."""
+    return SpecifierSet(spec)
+
+
 def validate_dependencies(metadata: dict[str, Any]) -> tuple[list[str], list[str]]:
     """Validate dependency metadata declared for a target.
 
@@ -187,7 +267,7 @@ def validate_dependencies(metadata: dict[str, Any]) -> tuple[list[str], list[str
                 errors.append(f"{label} for {name or '<unknown>'} is missing a `version` field.")
             else:
                 try:
-                    SpecifierSet(str(version))
+                    _parse_specifier(str(version))
                 except Exception as exc:
                     errors.append(
                         f"{label} for {name or '<unknown>'} has an invalid version specifier {version!r}: {exc}"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 import yaml
 
 from .. import metadata_utils
@@ -61,7 +62,7 @@ def test_create_metadata_targets_filters_and_validates(tmp_path: Path) -> None:
         },
     )
 
-    discovered = [(metadata_path, "component")]
+    discovered = [(metadata_path, "component", component_file)]
     targets = metadata_utils.create_metadata_targets(
         discovered,
         include_flagless=False,
@@ -106,8 +107,28 @@ def test_create_metadata_targets_filters_and_validates(tmp_path: Path) -> None:
     )
     assert targets == []
 
+    targets = metadata_utils.create_metadata_targets(
+        discovered,
+        include_flagless=False,
+        path_filters=[str(component_file)],
+        repo_root=repo_root,
+    )
+    assert len(targets) == 1
+
+    # A sibling directory sharing a name prefix must not match.
+    (repo_root / "components" / "training" / "sample").mkdir()
+    targets = metadata_utils.create_metadata_targets(
+        discovered,
+        include_flagless=False,
+        path_filters=[str(repo_root / "components" / "training" / "sample")],
+        repo_root=repo_root,
+    )
+    assert targets == []
+
     # If module file is missing, the target should be skipped.
     component_file.unlink()
+    discovered = metadata_utils.discover_metadata_files(repo_root=repo_root)
+    assert discovered == [(metadata_path, "component", None)]
     targets = metadata_utils.create_metadata_targets(
         discovered,
         include_flagless=False,
@@ -115,3 +136,45 @@ def test_create_metadata_targets_filters_and_validates(tmp_path: Path) -> None:
         repo_root=repo_root,
     )
     assert targets == []
+
+
+def test_discover_metadata_files_prunes_asset_and_cache_dirs(tmp_path: Path) -> None:
+    """Discovery stops at asset directories and skips cache directories."""
+    comp_dir = tmp_path / "components" / "training" / "sample_component"
+    nested_dir = comp_dir / "tests" / "test_data"
+    nested_dir.mkdir(parents=True)
+    _write_metadata(comp_dir / "metadata.yaml", {"name": "sample_component"})
+    _write_metadata(nested_dir / "metadata.yaml", {"name": "fixture"})
+
+    cache_dir = tmp_path / "components" / "training" / "__pycache__" / "cached"
+    cache_dir.mkdir(parents=True)
+    _write_metadata(cache_dir / "metadata.yaml", {"name": "cached"})
+
+    pipeline_dir = tmp_path / "pipelines" / "training" / "sample_pipeline"
+    pipeline_dir.mkdir(parents=True)
+    _write_metadata(pipeline_dir / "metadata.yaml", {"name": "sample_pipeline"})
+
+    discovered = metadata_utils.discover_metadata_files(repo_root=tmp_path)
+    assert discovered == [
+        (comp_dir / "metadata.yaml", "component", None),
+        (pipeline_dir / "metadata.yaml", "pipeline", None),
+    ]
+
+
+def test_create_metadata_targets_rejects_malformed_flagless_metadata(tmp_path: Path) -> None:
+    """Malformed metadata is reported even when it never mentions compile_check."""
+    comp_dir = tmp_path / "components" / "training" / "sample_component"
+    comp_dir.mkdir(parents=True)
+    component_file = comp_dir / "component.py"
+    component_file.write_text("", encoding="utf-8")
+    metadata_path = comp_dir / "metadata.yaml"
+    metadata_path.write_text("- not\n- a mapping\n", encoding="utf-8")
+
+    discovered = [(metadata_path, "component", component_file)]
+    with pytest.raises(ValueError, match="must be a mapping"):
+        metadata_utils.create_metadata_targets(
+            discovered,
+            include_flagless=False,
+            path_filters=[],
+            repo_root=tmp_path,
+        )
@@ -2,7 +2,8 @@
 """Pytest discovery helper for Kubeflow components and pipelines.
 
 This script discovers `tests/` directories under the provided component or
-pipeline paths and runs pytest with a two-minute timeout per test.
+pipeline paths and runs pytest with a two-minute timeout per test, optionally
+spreading tests across pytest-xdist workers.
 """
 
 from __future__ import annotations
@@ -19,6 +20,9 @@ from ..lib.discovery import get_repo_root, normalize_targets
 
 REPO_ROOT = get_repo_root()
 TIMEOUT_SECONDS = 120
+# Serial by default: the shared setup_and_teardown_subprocess_runner fixture uses
+# fixed workspace directories that parallel workers would delete under each other.
+WORKERS = "0"
 
 
 def parse_args() -> argparse.Namespace:
@@ -48,6 +52,14 @@ def parse_args() -> argparse.Namespace:
         default=TIMEOUT_SECONDS,
         help="Per-test timeout in seconds (default: 120).",
     )
+    parser.add_argument(
+        "--workers",
+        default=WORKERS,
+        help=(
+            "Number of pytest-xdist workers, or 'auto' for one per CPU. "
+            "The default of 0 runs tests serially in a single process."
+        ),
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -66,6 +78,9 @@ def discover_test_dirs(targets: Sequence[Path]) -> List[Path]:
         List of discovered tests/ directory paths.
     """
     discovered: List[Path] = []
+    # Overlapping targets rediscover the same directories; a set keeps the
+    # duplicate check constant-time while the list preserves discovery order.
+    seen: set[Path] = set()
 
     for target in targets:
         search_root = target if target.is_dir() else target.parent
@@ -75,15 +90,18 @@ def discover_test_dirs(targets: Sequence[Path]) -> List[Path]:
         # Direct tests/ folder
         direct = search_root / "tests"
         if direct.is_dir() and _is_member_of_pipeline_or_component(direct):
-            if direct not in discovered:
+            if direct not in seen:
+                seen.add(direct)
                 discovered.append(direct)
         else:
             # Broader target (category, subcategory, or repo root) –
             # recurse to find all nested tests/ directories.
             for tests_dir in sorted(search_root.rglob("tests")):
+                if tests_dir in seen:
+                    continue
                 if tests_dir.is_dir() and _is_member_of_pipeline_or_component(tests_dir):
-                    if tests_dir not in discovered:
-                        discovered.append(tests_dir)
+                    seen.add(tests_dir)
+                    discovered.append(tests_dir)
 
     return discovered
 
@@ -112,6 +130,7 @@ def build_pytest_args(
     test_dirs: Sequence[Path],
     timeout_seconds: int,
     verbose: bool,
+    workers: str = WORKERS,
 ) -> List[str]:
     """Build pytest command-line arguments.
 
@@ -119,6 +138,7 @@ def build_pytest_args(
         test_dirs: Directories containing tests to run.
         timeout_seconds: Per-test timeout in seconds.
         verbose: Whether to enable verbose pytest output.
+        workers: Number of pytest-xdist workers, 'auto', or '0' to run serially.
 
     Returns:
         List of pytest command-line arguments.
@@ -127,6 +147,10 @@ def build_pytest_args(
         f"--timeout={timeout_seconds}",
         "--timeout-method=signal",
     ]
+    if workers != "0":
+        # loadgroup keeps tests sharing an xdist_group mark (e.g. ones hitting the
+        # same rate-limited API) on one worker while everything else spreads out.
+        args.extend(["-n", workers, "--dist=loadgroup"])
     if verbose:
         args.append("-vv")
 
@@ -155,6 +179,7 @@ def main() -> int:
         test_dirs=test_dirs,
         timeout_seconds=args.timeout,
         verbose=args.verbose,
+        workers=args.workers,
     )
 
     exit_code = pytest.main(pytest_args)
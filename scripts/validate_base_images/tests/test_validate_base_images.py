@@ -36,9 +36,12 @@ from ..validate_base_images import (
 RESOURCES_DIR = Path(__file__).parent / "resources"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_allowlist():
-    """Load the default allowlist for tests that need it."""
+    """Load the default allowlist for tests that need it.
+
+    The allowlist is immutable, so it is parsed once and shared across the module.
+    """
     allowlist_path = Path(__file__).parent.parent / "base_image_allowlist.yaml"
     return load_base_image_allowlist(allowlist_path)
 